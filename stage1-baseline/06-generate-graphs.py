@@ -5,24 +5,70 @@ Produces graphs for latency, QPS, pod placement, and network analysis.
 """
 
 import argparse
-import glob
+import contextlib
+import csv
+import functools
+import hashlib
+import io
 import json
+import multiprocessing
 import os
+import pickle
+import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    import matplotlib.patheffects as pe
     import numpy as np
 except ImportError:
-    print("Error: matplotlib is required. Install with: pip3 install matplotlib")
+    print("Error: numpy is required. Install with: pip3 install numpy matplotlib")
     sys.exit(1)
 
+# matplotlib is imported on first use by _import_plotting(): pyplot initialises the
+# font manager and backend, which --help, error exits and the loaders don't need.
+matplotlib = plt = mpatches = pe = None
+
+
+def _import_plotting():
+    """Import matplotlib with the Agg backend into module globals (idempotent)."""
+    global matplotlib, plt, mpatches, pe
+    if plt is not None:
+        return
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as mpatches
+        import matplotlib.patheffects as pe
+    except ImportError:
+        print("Error: matplotlib is required. Install with: pip3 install matplotlib")
+        sys.exit(1)
+
+    # Rendering knobs: matplotlib's "fast" style simplifies dense line paths before
+    # rasterising and splits very long paths into chunks for Agg; default to screen
+    # resolution (override: --dpi).
+    plt.style.use("fast")
+    plt.rcParams["savefig.dpi"] = 150
+
+# orjson parses straight from bytes and is several times faster than the stdlib
+# decoder on the large fortio / kubectl snapshots; stdlib json is the fallback.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Large fortio results are dominated by the DurationHistogram.Data buckets,
+# which the graphs never read. With the C yajl backend of ijson those files
+# are stream-parsed and only the fields below are materialised.
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    ijson = None
+
 # ---------------------------------------------------------------------------
 # Online Boutique service call graph (caller -> [callees])
 # ---------------------------------------------------------------------------
@@ -71,17 +117,197 @@ BOUTIQUE_SERVICES = [
     "checkoutservice", "paymentservice", "shippingservice", "currencyservice",
 ]
 
+# Parsed loader outputs are memoized under <data_dir>/.cache (disable with --no-cache).
+# The cache key includes a hash of this script, so any code edit invalidates it;
+# CACHE_VERSION can still be bumped to force a re-parse.
+CACHE_ENABLED = True
+CACHE_VERSION = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _script_hash():
+    """sha1 of this script's source, mixed into every cache key."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # Data loaders
 # ---------------------------------------------------------------------------
 
+# Buffer size for files consumed line by line / streamed (JSONL logs, ijson).
+# Whole-file reads in _read_json are a single sized read() and don't need it.
+READ_BUFFER_BYTES = 64 * 1024
+
+
+def _read_json(path):
+    """Read and decode a JSON file (binary mode: orjson consumes bytes directly)."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def _natural_key(name):
+    """Sort key comparing digit runs numerically: burst-2 < burst-10."""
+    return [int(t) if i % 2 else t for i, t in enumerate(_DIGITS_RE.split(name))]
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_files(directory):
+    """Names of the regular files in directory, in natural order (one scan and sort per run).
+
+    The input directories are only read by this script, so the listing is
+    stable for the life of the process.
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.is_file()]
+    except FileNotFoundError:
+        return ()
+    return tuple(sorted(names, key=_natural_key))
+
+
+def _list_files(directory, prefix, suffix=".json"):
+    """Paths of the files in directory named <prefix>*<suffix>, in natural order.
+
+    Filters the cached _dir_files listing with plain string tests instead of
+    glob, which translates the pattern through fnmatch and re-reads the
+    directory per call. Natural order puts fortio-burst-<idx>-* files in burst
+    order, so the loaders' final (index, endpoint) sort runs over already-ordered
+    input. Timestamped snapshot names are fixed-width, so their order is unchanged.
+    """
+    return [os.path.join(directory, n) for n in _dir_files(directory)
+            if n.startswith(prefix) and n.endswith(suffix)]
+
+
+def _disk_cached(name, *inputs):
+    """Memoize a loader(data_dir) in <data_dir>/.cache/<name>.pkl.
+
+    inputs are (subdir, prefix, suffix) file selectors relative to data_dir.
+    The cache key hashes (path, mtime, size) of every selected file plus the
+    script source, so adding, removing or rewriting a snapshot, or editing the
+    loaders, invalidates it; otherwise reruns skip JSON parsing entirely.
+    """
+    def wrap(load):
+        @functools.wraps(load)
+        def cached(data_dir):
+            if not CACHE_ENABLED:
+                return load(data_dir)
+            h = hashlib.sha1(f"{name}:{CACHE_VERSION}:{_script_hash()}".encode())
+            for subdir, prefix, suffix in inputs:
+                for path in _list_files(os.path.join(data_dir, subdir), prefix, suffix):
+                    st = os.stat(path)
+                    h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+            key = h.hexdigest()
+            cache_path = os.path.join(data_dir, ".cache", f"{name}.pkl")
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_key, value = pickle.load(f)
+                if cached_key == key:
+                    return value
+            except Exception:
+                pass
+            value = load(data_dir)
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"  ⚠ Could not write cache {cache_path}: {e}")
+            return value
+        return cached
+    return wrap
+
+
+def _try_parse(parse, path):
+    try:
+        return parse(path), None
+    except Exception as e:
+        return None, e
+
+
+# Below this many files, worker-process startup and result pickling cost more
+# than the decode itself; a thread pool still overlaps the file reads.
+PROCESS_POOL_MIN_FILES = 64
+
+
+def _parse_files(parse, paths):
+    """Run parse(path) for every path across a thread or process pool.
+
+    Files are independent: small batches use threads (I/O overlaps, no spawn
+    cost), large ones a process pool so decoding scales with cores.
+    Returns [(path, result, error)] in input order; a file that fails to parse
+    carries its exception instead of aborting the batch.
+    """
+    if len(paths) < 2:
+        results = [_try_parse(parse, p) for p in paths]
+    elif len(paths) < PROCESS_POOL_MIN_FILES:
+        with ThreadPoolExecutor() as ex:
+            results = list(ex.map(_try_parse, repeat(parse), paths))
+    else:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_try_parse, repeat(parse), paths, chunksize=8))
+    return [(p, res, err) for p, (res, err) in zip(paths, results)]
+
+
+FORTIO_STREAM_MIN_BYTES = 100 * 1024
+_FORTIO_SCALARS = {
+    "StartTime", "RequestedQPS", "ActualQPS", "ActualDuration",
+    "DurationHistogram.Avg", "DurationHistogram.Count",
+}
+_FORTIO_LISTS = {
+    "DurationHistogram.Percentiles.item",
+    "ConnectionStats.Percentiles.item",
+    "ConnectionStats.Data.item",
+}
+
+
+def _stream_fortio_json(path):
+    """Stream-parse a fortio result, keeping only the fields _parse_fortio_burst_file reads.
+
+    Returns a dict with the same nesting as the full document, minus
+    DurationHistogram.Data and everything else unused.
+    """
+    data  = {}
+    lists = {}
+    item  = None
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as f:
+        for prefix, event, value in ijson.parse(f, buf_size=READ_BUFFER_BYTES, use_float=True):
+            if event == "start_map" and prefix in _FORTIO_LISTS:
+                item = {}
+                lists.setdefault(prefix, []).append(item)
+            elif event == "end_map" and prefix in _FORTIO_LISTS:
+                item = None
+            elif event in ("start_map", "end_map", "start_array", "end_array", "map_key"):
+                continue
+            elif item is not None:
+                parent, _, key = prefix.rpartition(".")
+                if parent in _FORTIO_LISTS:
+                    item[key] = value
+            elif prefix in _FORTIO_SCALARS:
+                section, _, key = prefix.rpartition(".")
+                (data.setdefault(section, {}) if section else data)[key] = value
+    for prefix, items in lists.items():
+        section, key, _ = prefix.split(".")
+        data.setdefault(section, {})[key] = items
+    return data
+
+
+def _read_fortio_json(path):
+    if ijson is not None and os.path.getsize(path) >= FORTIO_STREAM_MIN_BYTES:
+        return _stream_fortio_json(path)
+    return _read_json(path)
+
+
 def _parse_fortio_burst_file(file_path, burst_index, endpoint):
     """Parse a single fortio JSON result file into the standard burst record."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    percentiles = {p["Percentile"]: p["Value"] for p in
-                   data.get("DurationHistogram", {}).get("Percentiles", [])}
+    data = _read_fortio_json(file_path)
+    hist = data.get("DurationHistogram", {})
+    pget = {p["Percentile"]: p["Value"] for p in hist.get("Percentiles", [])}.get
     conn_stats = data.get("ConnectionStats", {})
     conn_p50 = conn_p95 = None
     for cp in conn_stats.get("Percentiles", []):
@@ -98,13 +324,13 @@ def _parse_fortio_burst_file(file_path, burst_index, endpoint):
         "requested_qps": float(data.get("RequestedQPS", 0)),
         "actual_qps":    data.get("ActualQPS", 0),
         "duration_s":    data.get("ActualDuration", 0) / 1e9,
-        "p50":  percentiles.get(50,   0),
-        "p90":  percentiles.get(90,   0),
-        "p95":  percentiles.get(95,   0),
-        "p99":  percentiles.get(99,   0),
-        "p999": percentiles.get(99.9, 0),
-        "avg":  data.get("DurationHistogram", {}).get("Avg", 0),
-        "count": data.get("DurationHistogram", {}).get("Count", 0),
+        "p50":  pget(50,   0),
+        "p90":  pget(90,   0),
+        "p95":  pget(95,   0),
+        "p99":  pget(99,   0),
+        "p999": pget(99.9, 0),
+        "avg":  hist.get("Avg", 0),
+        "count": hist.get("Count", 0),
         "error_rate": 0.0,
         "conn_p50_ms":  conn_p50,
         "conn_p95_ms":  conn_p95,
@@ -116,14 +342,25 @@ def _parse_fortio_burst_file(file_path, burst_index, endpoint):
     }
 
 
+def _parse_burst_file(file_path):
+    """Parse fortio-burst-<idx>-<endpoint>.json; index is None if the name carries none."""
+    base   = os.path.basename(file_path).replace(".json", "").replace("fortio-burst-", "")
+    parts  = base.split("-")
+    try:
+        burst_index = int(parts[0])
+    except (ValueError, IndexError):
+        burst_index = None
+    endpoint = parts[1] if len(parts) >= 2 else "all"
+    return _parse_fortio_burst_file(file_path, burst_index, endpoint)
+
+
 def _parse_k6_burst_file(file_path):
     """Parse a k6 handleSummary JSON file into one burst record per endpoint.
 
     k6 writes times in seconds (converted from ms in handleSummary).
     Returns a list of burst records — one per endpoint in the summary.
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    data = _read_json(file_path)
 
     burst_index  = data.get("burst_index", 0)
     burst_type   = data.get("burst_type",  "unknown")
@@ -161,40 +398,68 @@ def _parse_k6_burst_file(file_path):
     return records
 
 
+# Burst records as one structured array, built once at load time (and cached):
+# plots slice contiguous columns (arr["p95"] * 1000) instead of re-walking a
+# list of dicts. Missing connection stats are NaN; conn_times_ms holds the
+# per-burst sample list.
+BURST_DTYPE = np.dtype([
+    ("index",         "i8"),
+    ("endpoint",      "O"),
+    ("burst_type",    "O"),
+    ("requested_qps", "f8"),
+    ("actual_qps",    "f8"),
+    ("p50",           "f8"),
+    ("p90",           "f8"),
+    ("p95",           "f8"),
+    ("p99",           "f8"),
+    ("p999",          "f8"),
+    ("avg",           "f8"),
+    ("count",         "i8"),
+    ("error_rate",    "f8"),
+    ("conn_p50_ms",   "f8"),
+    ("conn_p95_ms",   "f8"),
+    ("conn_times_ms", "O"),
+])
+
+
+def _bursts_to_array(bursts):
+    """Pack burst records into a BURST_DTYPE structured array (one row per record)."""
+    names = BURST_DTYPE.names
+    return np.array([tuple(b[n] for n in names) for b in bursts], dtype=BURST_DTYPE)
+
+
+@_disk_cached("bursts", ("loadgen", "k6-burst-", ".json"), ("loadgen", "fortio-burst-", ".json"))
 def load_burst_data(data_dir):
     """Load latency data from k6 or fortio burst files in loadgen/.
 
     Prefers k6-burst-*.json (new format); falls back to fortio-burst-*.json
     (legacy format) so old experiment runs still graph correctly.
+    Returns a BURST_DTYPE array sorted by (index, endpoint).
     """
     loadgen_dir = os.path.join(data_dir, "loadgen")
     bursts = []
 
     # ── k6 output (primary) ───────────────────────────────────────────────────
-    k6_files = sorted(glob.glob(os.path.join(loadgen_dir, "k6-burst-*.json")))
-    for file_path in k6_files:
-        try:
-            bursts.extend(_parse_k6_burst_file(file_path))
-        except Exception as e:
+    k6_files = _list_files(loadgen_dir, "k6-burst-")
+    for file_path, records, e in _parse_files(_parse_k6_burst_file, k6_files):
+        if e is not None:
             print(f"  ⚠ Could not parse {os.path.basename(file_path)}: {e}")
+            continue
+        bursts.extend(records)
 
     # ── fortio output (fallback for legacy runs) ──────────────────────────────
     if not bursts:
-        fortio_files = sorted(glob.glob(os.path.join(loadgen_dir, "fortio-burst-*.json")))
-        for file_path in fortio_files:
-            base   = os.path.basename(file_path).replace(".json", "").replace("fortio-burst-", "")
-            parts  = base.split("-")
-            try:
-                burst_index = int(parts[0])
-            except (ValueError, IndexError):
-                burst_index = len(bursts)
-            endpoint = parts[1] if len(parts) >= 2 else "all"
-            try:
-                bursts.append(_parse_fortio_burst_file(file_path, burst_index, endpoint))
-            except Exception as e:
+        fortio_files = _list_files(loadgen_dir, "fortio-burst-")
+        for file_path, burst_info, e in _parse_files(_parse_burst_file, fortio_files):
+            if e is not None:
                 print(f"  ⚠ Could not parse {os.path.basename(file_path)}: {e}")
+                continue
+            if burst_info["index"] is None:
+                burst_info["index"] = len(bursts)
+            bursts.append(burst_info)
 
-    return sorted(bursts, key=lambda x: (x["index"], x["endpoint"]))
+    bursts.sort(key=lambda x: (x["index"], x["endpoint"]))
+    return _bursts_to_array(bursts)
 
 
 def load_bursts_jsonl(data_dir):
@@ -203,17 +468,42 @@ def load_bursts_jsonl(data_dir):
     if not os.path.exists(path):
         return []
     rows = []
-    with open(path) as f:
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as f:
         for line in f:
             line = line.strip()
             if line:
                 try:
-                    rows.append(json.loads(line))
+                    rows.append(_json_loads(line))
                 except Exception:
                     pass
     return rows
 
 
+def _default_pod_node(pod):
+    """nodeName of a default-namespace pod, or None.
+
+    Direct indexing: a missing key means "not a scheduled default pod", which is
+    cheaper to catch than allocating .get() defaults per pod.
+    """
+    try:
+        if pod["metadata"]["namespace"] == "default":
+            return pod["spec"]["nodeName"]
+    except KeyError:
+        pass
+    return None
+
+
+_UNSCHEDULED = (None, "", "unknown")
+
+
+def _count_pod_nodes(path):
+    """Return {node: pod count} for default-namespace pods in one kubectl pod snapshot."""
+    snap = _read_json(path)
+    return dict(Counter(node for node in map(_default_pod_node, snap.get("items", ()))
+                        if node not in _UNSCHEDULED))
+
+
+@_disk_cached("snapshots", ("pod-placement", "", ""), ("network-analysis", "pod-network-", ".json"))
 def load_pod_placement_data(data_dir):
     """Load pod placement snapshots; prefer pod-placement/, fall back to pod-network-*.json."""
     placement_dir = os.path.join(data_dir, "pod-placement")
@@ -221,40 +511,35 @@ def load_pod_placement_data(data_dir):
     if os.path.exists(placement_dir):
         index_file = os.path.join(placement_dir, "index.jsonl")
         if os.path.exists(index_file):
+            # One read for the whole (small) index, then decode line by line
+            with open(index_file, 'rb') as f:
+                lines = f.read().splitlines()
+            entries = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                entry = _json_loads(line)
+                sf = os.path.join(placement_dir, entry["file"])
+                if os.path.exists(sf):
+                    entries.append((entry, sf))
+            counted = _parse_files(_count_pod_nodes, [sf for _, sf in entries])
             snapshots = []
-            with open(index_file, 'r') as f:
-                for line in f:
-                    entry = json.loads(line.strip())
-                    sf = os.path.join(placement_dir, entry["file"])
-                    if not os.path.exists(sf):
-                        continue
-                    with open(sf, 'r') as fh:
-                        snap = json.load(fh)
-                    nc = defaultdict(int)
-                    for pod in snap.get("items", []):
-                        if pod.get("metadata", {}).get("namespace") == "default":
-                            node = pod.get("spec", {}).get("nodeName", "unknown")
-                            if node and node != "unknown":
-                                nc[node] += 1
-                    snapshots.append({"timestamp": entry["timestamp"],
-                                      "index": int(entry["file"].replace("pods-", "").replace(".json", "")),
-                                      "node_counts": dict(nc)})
+            for (entry, _), (_, nc, e) in zip(entries, counted):
+                if e is not None:
+                    raise e
+                snapshots.append({"timestamp": entry["timestamp"],
+                                  "index": int(entry["file"].replace("pods-", "").replace(".json", "")),
+                                  "node_counts": nc})
             if snapshots:
                 return sorted(snapshots, key=lambda x: x["index"])
     if os.path.exists(network_dir):
-        pod_files = sorted(glob.glob(os.path.join(network_dir, "pod-network-*.json")))
+        pod_files = _list_files(network_dir, "pod-network-")
         snapshots = []
-        for i, fp in enumerate(pod_files):
-            with open(fp) as f:
-                snap = json.load(f)
+        for i, (fp, nc, e) in enumerate(_parse_files(_count_pod_nodes, pod_files)):
+            if e is not None:
+                raise e
             stem = os.path.basename(fp).replace("pod-network-", "").replace(".json", "")
-            nc = defaultdict(int)
-            for pod in snap.get("items", []):
-                if pod.get("metadata", {}).get("namespace") == "default":
-                    node = pod.get("spec", {}).get("nodeName", "unknown")
-                    if node and node != "unknown":
-                        nc[node] += 1
-            snapshots.append({"timestamp": stem, "index": i, "node_counts": dict(nc)})
+            snapshots.append({"timestamp": stem, "index": i, "node_counts": nc})
         if snapshots:
             return snapshots
     return None
@@ -265,51 +550,98 @@ def load_service_placement(data_dir):
     if not os.path.exists(path):
         return None
     try:
-        with open(path) as f:
-            return json.load(f)
+        return _read_json(path)
     except Exception:
         return None
 
 
+S2S_DTYPE = np.dtype([
+    ("timestamp",      "O"),
+    ("source_pod",     "O"),
+    ("source_node",    "O"),
+    ("target_service", "O"),
+    ("is_grpc",        "?"),
+    ("dns",            "f8"),
+    ("connect",        "f8"),
+    ("ttfb",           "f8"),
+    ("total",          "f8"),
+    ("code",           "f8"),
+])
+S2S_METRICS = ("dns", "connect", "ttfb", "total", "code")
+
+# One "key=value" token of a probe string (anchored at token start, value may be empty)
+_PROBE_RE = re.compile(r"(?<!\S)([^\s=]*)=(\S*)")
+
+
+@_disk_cached("s2s", ("network-analysis", "service-to-service-latency.jsonl", ""))
 def load_s2s_data(data_dir):
-    """Load service-to-service probe records."""
+    """Load service-to-service probe records as an S2S_DTYPE array (missing metrics are NaN)."""
     path = os.path.join(data_dir, "network-analysis", "service-to-service-latency.jsonl")
     if not os.path.exists(path):
-        return []
-    records = []
-    with open(path) as f:
+        return np.empty(0, dtype=S2S_DTYPE)
+    rows = []
+    # Binary mode: lines go to orjson as bytes, skipping the text-decode layer
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                row = json.loads(line)
+                row = _json_loads(line)
             except Exception:
                 continue
             metrics = {}
-            for token in row.get("probe", "").split():
-                if "=" in token:
-                    k, v = token.split("=", 1)
-                    try:
-                        metrics[k] = float(v)
-                    except ValueError:
-                        try:
-                            metrics[k] = int(v)
-                        except ValueError:
-                            pass
-            records.append({
-                "timestamp": row.get("timestamp", ""),
-                "source_pod": row.get("source_pod", "unknown"),
-                "source_node": row.get("source_node", "unknown"),
-                "target_service": row.get("target_service", "unknown"),
-                "is_grpc": bool(metrics.get("grpc")),
-                **metrics,
-            })
-    return records
+            for k, v in _PROBE_RE.findall(row.get("probe", "")):
+                try:
+                    metrics[k] = float(v)
+                except ValueError:
+                    pass
+            rows.append((
+                row.get("timestamp", ""),
+                row.get("source_pod", "unknown"),
+                row.get("source_node", "unknown"),
+                row.get("target_service", "unknown"),
+                bool(metrics.get("grpc")),
+                *(metrics.get(m, np.nan) for m in S2S_METRICS),
+            ))
+    return np.array(rows, dtype=S2S_DTYPE)
+
+
+def _endpoint_service_nodes(path):
+    """Return {service: set(nodes)} from one service-endpoints snapshot."""
+    payload = _read_json(path)
+    svc_nodes = defaultdict(set)
+    for item in payload.get("items", []):
+        svc = (item.get("metadata") or {}).get("name", "unknown")
+        for subset in item.get("subsets", []) or []:
+            for addr in subset.get("addresses", []) or []:
+                node = addr.get("nodeName")
+                if node:
+                    svc_nodes[svc].add(node)
+    return svc_nodes
+
+
+def _pod_service_nodes(path):
+    """Return {app: set(nodes)} for running default-namespace pods in one pod snapshot."""
+    payload = _read_json(path)
+    svc_nodes = defaultdict(set)
+    for item in payload.get("items", []):
+        ns = (item.get("metadata") or {}).get("namespace", "")
+        if ns not in ("", "default"):
+            continue
+        labels = (item.get("metadata") or {}).get("labels", {})
+        app = labels.get("app") or labels.get("app.kubernetes.io/name")
+        node = (item.get("spec") or {}).get("nodeName")
+        phase = (item.get("status") or {}).get("phase", "")
+        if app and node and phase == "Running":
+            svc_nodes[app].add(node)
+    return svc_nodes
 
 
+@_disk_cached("service_nodes", ("network-analysis", "service-endpoints-", ".json"),
+              ("network-analysis", "pod-network-", ".json"), ("baseline", "pods.json", ""))
 def load_service_endpoint_nodes(data_dir):
-    """Return {service_name: set(node_names)}.
+    """Return {service_name: frozenset(node_names)}.
 
     Preferred: service-endpoints-*.json (kubectl get endpoints).
     Fallback:  pod-network-*.json + baseline/pods.json (kubectl get pods).
@@ -318,94 +650,146 @@ def load_service_endpoint_nodes(data_dir):
     svc_nodes = defaultdict(set)
 
     # --- primary: endpoint snapshots ---
-    for path in sorted(glob.glob(os.path.join(network_dir, "service-endpoints-*.json"))):
-        try:
-            with open(path) as f:
-                payload = json.load(f)
-        except Exception:
+    ep_files = _list_files(network_dir, "service-endpoints-")
+    for _, per_file, e in _parse_files(_endpoint_service_nodes, ep_files):
+        if e is not None:
             continue
-        for item in payload.get("items", []):
-            svc = (item.get("metadata") or {}).get("name", "unknown")
-            for subset in item.get("subsets", []) or []:
-                for addr in subset.get("addresses", []) or []:
-                    node = addr.get("nodeName")
-                    if node:
-                        svc_nodes[svc].add(node)
+        for svc, nodes in per_file.items():
+            svc_nodes[svc].update(nodes)
 
     # --- fallback: pod-network snapshots + baseline pods.json ---
     if not svc_nodes:
-        pod_sources = sorted(glob.glob(os.path.join(network_dir, "pod-network-*.json")))
+        pod_sources = _list_files(network_dir, "pod-network-")
         baseline_pods = os.path.join(data_dir, "baseline", "pods.json")
         if os.path.exists(baseline_pods):
             pod_sources = [baseline_pods] + pod_sources
-        for path in pod_sources:
-            try:
-                with open(path) as f:
-                    payload = json.load(f)
-            except Exception:
+        for _, per_file, e in _parse_files(_pod_service_nodes, pod_sources):
+            if e is not None:
                 continue
-            for item in payload.get("items", []):
-                ns = (item.get("metadata") or {}).get("namespace", "")
-                if ns not in ("", "default"):
-                    continue
-                labels = (item.get("metadata") or {}).get("labels", {})
-                app = labels.get("app") or labels.get("app.kubernetes.io/name")
-                node = (item.get("spec") or {}).get("nodeName")
-                phase = (item.get("status") or {}).get("phase", "")
-                if app and node and phase == "Running":
-                    svc_nodes[app].add(node)
+            for app, nodes in per_file.items():
+                svc_nodes[app].update(nodes)
 
-    return {k: v for k, v in svc_nodes.items()}
+    return {k: frozenset(v) for k, v in svc_nodes.items()}
 
 
 def load_latency_vs_replicas(data_dir):
-    """Load network-analysis/latency-vs-replicas.csv."""
+    """Load network-analysis/latency-vs-replicas.csv as columns, one entry per row.
+
+    Returns {"total_replicas": int64, "s2s_p95_ms": float64, "node_count": float64}
+    arrays; blank or unparseable cells are NaN. Arrays are empty if the CSV is missing.
+    """
     path = os.path.join(data_dir, "network-analysis", "latency-vs-replicas.csv")
-    if not os.path.exists(path):
-        return []
     rows = []
-    with open(path) as f:
-        header = None
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            if header is None:
-                header = line.split(",")
-                continue
-            rows.append(dict(zip(header, line.split(","))))
-    return rows
+    if os.path.exists(path):
+        # csv handles quoting; short rows get "" for missing columns, surplus
+        # fields land under "_extra" instead of shifting later columns.
+        with open(path, newline="", encoding="utf-8", errors="replace") as f:
+            rows = list(csv.DictReader(f, restkey="_extra", restval=""))
+    return {
+        "total_replicas": np.array([_total_current_replicas(r) for r in rows], dtype=np.int64),
+        "s2s_p95_ms":     np.array([_parse_cell(r["s2s_p95_ms"], float) if "s2s_p95_ms" in r
+                                    else np.nan for r in rows], dtype=np.float64),
+        "node_count":     np.array([_parse_cell(r["node_count"], int) if "node_count" in r
+                                    else np.nan for r in rows], dtype=np.float64),
+    }
+
+
+def _parse_cell(v, cast):
+    try:
+        return cast(v)
+    except ValueError:
+        return np.nan
+
+
+def _total_current_replicas(row):
+    """Sum the <service>_current replica columns of one latency-vs-replicas row."""
+    return sum(int(v) for k, v in row.items()
+               if k.endswith("_current") and v and v.isdigit())
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _endpoints_present(bursts_arr):
+    present = set(bursts_arr["endpoint"].tolist())
+    return [e for e in ENDPOINT_ORDER if e in present] or sorted(present)
+
+
+def _group_p95(keys, values):
+    """Nearest-rank p95 of `values` per distinct integer key.
+
+    Returns (unique_keys, p95s); matches sorted(vals)[min(int(n * 0.95), n - 1)]
+    for each group, computed with one lexsort instead of a sort per group.
+    """
+    order = np.lexsort((values, keys))          # by key, then by value
+    keys_s, vals_s = keys[order], values[order]
+    uniq, starts, counts = np.unique(keys_s, return_index=True, return_counts=True)
+    ranks = np.minimum((counts * 0.95).astype(np.int64), counts - 1)
+    return uniq, vals_s[starts + ranks]
+
+
+CDF_MAX_POINTS = 4096
+
+
+def _cdf_points(sv, max_points=CDF_MAX_POINTS):
+    """(x, y) of the empirical CDF of sorted `sv`, thinned to at most max_points.
+
+    Beyond a few thousand vertices the line is visually unchanged but Agg
+    still strokes every segment, so large sample sets are sampled evenly.
+    """
+    n = len(sv)
+    idx = np.arange(n) if n <= max_points else np.linspace(0, n - 1, max_points).astype(np.int64)
+    return sv[idx], (idx + 1) / n
+
+
+@functools.lru_cache(maxsize=4096)
 def short_node(n):
     return n.split(".")[0] if n else n
 
 
-def detect_warmup_burst(bursts):
+def _node_count_matrix(snapshots):
+    """Return (sorted node names, int array [snapshot, node]) of pod counts.
+
+    A node absent from a snapshot counts 0, so per-node stats are column reductions.
+    """
+    nodes = sorted({node for snap in snapshots for node in snap["node_counts"]})
+    col = {n: j for j, n in enumerate(nodes)}
+    counts = np.zeros((len(snapshots), len(nodes)), dtype=np.int64)
+    for i, snap in enumerate(snapshots):
+        for node, c in snap["node_counts"].items():
+            counts[i, col[node]] = c
+    return nodes, counts
+
+
+def _last_per_index(idx, vals):
+    """Return (sorted unique burst indices, value of the last row for each index)."""
+    uniq, first_in_reversed = np.unique(idx[::-1], return_index=True)
+    return uniq, vals[::-1][first_in_reversed]
+
+
+def detect_warmup_burst(bursts_arr):
     """Return the first burst index considered 'steady-state' (warm-up ends here).
     Uses heuristic: steady-state starts when p95 drops below 2× its trailing median.
     Returns the burst index (inclusive) where steady-state begins.
     """
-    p95s = [b["p95"] * 1000 for b in bursts]
+    p95s = bursts_arr["p95"] * 1000
     if len(p95s) < 4:
         return 0
     # Trailing median from the back half
-    back_half = sorted(p95s[len(p95s)//2:])
+    back_half = np.sort(p95s[len(p95s)//2:])
     steady_p95 = back_half[len(back_half)//2]
     threshold = steady_p95 * 2.0
-    for i, v in enumerate(p95s):
-        if v <= threshold:
-            return i
-    return len(p95s) - 1
+    steady = np.flatnonzero(p95s <= threshold)
+    return int(steady[0]) if len(steady) else len(p95s) - 1
 
 
 def _save(fig, output_dir, filename):
     path = os.path.join(output_dir, filename)
-    fig.savefig(path, dpi=150, bbox_inches="tight")
+    # zlib level 1: PNGs come out somewhat larger but encode several times faster.
+    # bbox_inches="tight" stays: constrained layout cannot shrink a title wider than
+    # the figure (e.g. graph 14), and the tight bbox grows the canvas to fit it.
+    fig.savefig(path, bbox_inches="tight", pil_kwargs={"optimize": False, "compress_level": 1})
     print(f"✓ Generated: {path}")
     plt.close(fig)
 
@@ -414,12 +798,12 @@ def _save(fig, output_dir, filename):
 # Graph 01 – QPS: actual vs configured, colored by endpoint
 # ---------------------------------------------------------------------------
 
-def plot_qps_comparison(bursts, output_dir, bursts_config=None):
+def plot_qps_comparison(bursts_arr, output_dir, bursts_config=None):
     """Bar chart: actual QPS per burst colored by burst type (spike vs heavy_tail)."""
     # Sum actual_qps across all endpoints for each burst index
-    by_index = defaultdict(float)
-    for b in bursts:
-        by_index[b["index"]] += b["actual_qps"]
+    uniq_idx, inverse = np.unique(bursts_arr["index"], return_inverse=True)
+    vals = np.bincount(inverse, weights=bursts_arr["actual_qps"])
+    all_indices = uniq_idx.tolist()
 
     # Build burst_type and requested_qps maps from bursts_config or burst records
     burst_type_map = {}
@@ -432,17 +816,13 @@ def plot_qps_comparison(bursts, output_dir, bursts_config=None):
                 requested_qps_map[idx] = row.get("total_qps", row.get("requested_qps", 0))
     if not burst_type_map:
         # Fall back to per-burst record metadata (k6 records carry burst_type)
-        seen = {}
-        for b in bursts:
-            idx = b["index"]
-            if idx not in seen:
-                seen[idx] = b.get("burst_type", "unknown")
-                burst_type_map[idx] = seen[idx]
-                requested_qps_map[idx] = b.get("requested_qps", 0)
-
-    all_indices = sorted(by_index.keys())
+        for idx, bt, req in zip(bursts_arr["index"].tolist(), bursts_arr["burst_type"],
+                                bursts_arr["requested_qps"].tolist()):
+            if idx not in burst_type_map:
+                burst_type_map[idx] = bt
+                requested_qps_map[idx] = req
+
     x = np.arange(len(all_indices))
-    vals = [by_index[i] for i in all_indices]
 
     SPIKE_COLOR      = "#e08d1e"   # amber
     HEAVY_TAIL_COLOR = "#4393c3"   # steel blue
@@ -458,7 +838,7 @@ def plot_qps_comparison(bursts, output_dir, bursts_config=None):
         else:
             bar_colors.append(UNKNOWN_COLOR)
 
-    fig, ax = plt.subplots(figsize=(14, 6))
+    fig, ax = plt.subplots(figsize=(14, 6), layout="constrained")
     bars = ax.bar(x, vals, color=bar_colors, alpha=0.85, zorder=2)
 
     # Configured QPS line — use secondary Y axis when configured >> actual
@@ -472,7 +852,7 @@ def plot_qps_comparison(bursts, output_dir, bursts_config=None):
         req_vals  = [requested_qps_map.get(i, None) for i in all_indices]
         valid     = [(xi, v) for xi, v in zip(x, req_vals) if v]
         max_req   = max(v for _, v in valid) if valid else 0
-        max_act   = max(vals) if vals else 1
+        max_act   = vals.max() if len(vals) else 1
 
         if valid:
             xs_v, ys_v = zip(*valid)
@@ -502,7 +882,6 @@ def plot_qps_comparison(bursts, output_dir, bursts_config=None):
     ax.set_xticks(x)
     ax.set_xticklabels([str(i) for i in all_indices], fontsize=9)
     ax.grid(True, alpha=0.3, axis="y", zorder=0)
-    plt.tight_layout()
     _save(fig, output_dir, "01_qps_comparison.png")
 
 
@@ -510,33 +889,29 @@ def plot_qps_comparison(bursts, output_dir, bursts_config=None):
 # Graph 02 – Latency percentiles per endpoint over bursts
 # ---------------------------------------------------------------------------
 
-def plot_latency_percentiles(bursts, output_dir):
+def plot_latency_percentiles(bursts_arr, output_dir):
     """Per-endpoint p95 lines over burst index, with warm-up phase annotated."""
-    by_ep = defaultdict(dict)
-    for b in bursts:
-        by_ep[b["endpoint"]][b["index"]] = b
+    # One dense (N, 4) array of p50/p95/p99/qps; like graphs 13 and 15, a duplicate
+    # (endpoint, index) keeps its last record (_last_per_index).
+    ep_all   = bursts_arr["endpoint"]
+    idx_all  = bursts_arr["index"]
+    vals_all = np.column_stack([bursts_arr[k] for k in ("p50", "p95", "p99", "actual_qps")])
 
-    endpoints = [e for e in ENDPOINT_ORDER if e in by_ep]
-    if not endpoints:
-        endpoints = sorted(by_ep.keys())
-
-    all_idx = sorted({b["index"] for b in bursts})
-    warmup_end = detect_warmup_burst(bursts)
+    endpoints = _endpoints_present(bursts_arr)
+    warmup_end = detect_warmup_burst(bursts_arr)
 
     fig, axes = plt.subplots(len(endpoints), 1,
                              figsize=(14, 3.5 * len(endpoints)),
-                             sharex=True)
+                             sharex=True, layout="constrained")
     if len(endpoints) == 1:
         axes = [axes]
 
     for ax, ep in zip(axes, endpoints):
-        idx_to_burst = by_ep[ep]
-        idx_list = sorted(idx_to_burst.keys())
-        p50  = [idx_to_burst[i]["p50"]  * 1000 for i in idx_list]
-        p95  = [idx_to_burst[i]["p95"]  * 1000 for i in idx_list]
-        p99  = [idx_to_burst[i]["p99"]  * 1000 for i in idx_list]
-        qps  = [idx_to_burst[i]["actual_qps"] for i in idx_list]
-        max_qps = max(qps) if qps else 1
+        sel = ep_all == ep
+        idx_list, rows = _last_per_index(idx_all[sel], vals_all[sel])
+        rows = rows * np.array([1000, 1000, 1000, 1])
+        p50, p95, p99, qps = rows.T
+        max_qps = qps.max() if len(qps) else 1
 
         # Background QPS
         ax2 = ax.twinx()
@@ -549,7 +924,7 @@ def plot_latency_percentiles(bursts, output_dir):
         ax2.tick_params(axis="y", colors="grey")
 
         # Warm-up shading
-        if warmup_end > 0 and idx_list:
+        if warmup_end > 0 and len(idx_list):
             ax.axvspan(idx_list[0] - 0.5, warmup_end - 0.5,
                        color="#ffe0b2", alpha=0.45, zorder=0, label="Warm-up (HPA scaling)")
             ax.axvline(warmup_end - 0.5, color="#e65100", linewidth=1.2,
@@ -558,9 +933,10 @@ def plot_latency_percentiles(bursts, output_dir):
                     "HPA stabilised →", fontsize=8, color="#e65100", va="bottom")
 
         c = ENDPOINT_COLORS.get(ep, "#444")
-        ax.plot(idx_list, p50,  "o-",  color=c,          linewidth=1.5, markersize=4, label="p50",  alpha=0.6)
-        ax.plot(idx_list, p95,  "s-",  color=c,          linewidth=2,   markersize=5, label="p95")
-        ax.plot(idx_list, p99,  "^--", color=c,          linewidth=1.5, markersize=4, label="p99",  alpha=0.7)
+        me = max(1, len(idx_list) // 50)   # cap markers at ~50 per line on long runs
+        ax.plot(idx_list, p50,  "o-",  color=c,          linewidth=1.5, markersize=4, label="p50",  alpha=0.6, markevery=me)
+        ax.plot(idx_list, p95,  "s-",  color=c,          linewidth=2,   markersize=5, label="p95",  markevery=me)
+        ax.plot(idx_list, p99,  "^--", color=c,          linewidth=1.5, markersize=4, label="p99",  alpha=0.7, markevery=me)
 
         ax.set_ylabel("Latency (ms)", fontsize=11)
         ax.set_title(f"/{ep} endpoint", fontsize=11, fontweight="bold", loc="left")
@@ -572,8 +948,7 @@ def plot_latency_percentiles(bursts, output_dir):
     axes[-1].set_xlabel("Burst index", fontsize=12)
     fig.suptitle("2. Response: latency percentiles per endpoint over traffic bursts\n"
                  "(Shaded = HPA warm-up; lines = p50/p95/p99; bars = QPS)",
-                 fontsize=13, fontweight="bold", y=1.01)
-    plt.tight_layout()
+                 fontsize=13, fontweight="bold")
     _save(fig, output_dir, "02_latency_percentiles.png")
 
 
@@ -581,17 +956,21 @@ def plot_latency_percentiles(bursts, output_dir):
 # Graph 03 – Latency vs QPS scatter, colored by phase
 # ---------------------------------------------------------------------------
 
-def plot_latency_vs_qps(bursts, output_dir):
+def plot_latency_vs_qps(bursts_arr, output_dir):
     """Scatter: latency (p50/p95/p99) vs actual QPS, colored by percentile."""
-    qps  = [b["actual_qps"]   for b in bursts]
-    p50  = [b["p50"]  * 1000  for b in bursts]
-    p95  = [b["p95"]  * 1000  for b in bursts]
-    p99  = [b["p99"]  * 1000  for b in bursts]
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.scatter(qps, p50, alpha=0.7, s=60, label="p50", marker="o", color="#4393c3")
-    ax.scatter(qps, p95, alpha=0.7, s=60, label="p95", marker="s", color="#d6604d")
-    ax.scatter(qps, p99, alpha=0.7, s=60, label="p99", marker="^", color="#4dac26")
+    qps  = bursts_arr["actual_qps"]
+    p50  = bursts_arr["p50"] * 1000
+    p95  = bursts_arr["p95"] * 1000
+    p99  = bursts_arr["p99"] * 1000
+
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
+    # Uniform-size markers: Line2D with no line draws much cheaper than a scatter
+    # PathCollection (no per-point size/colour arrays). markersize is in points,
+    # so sqrt of the old scatter area (s=60 pt²) keeps the same marker size.
+    ms = np.sqrt(60)
+    ax.plot(qps, p50, linestyle="none", marker="o", markersize=ms, alpha=0.7, label="p50", color="#4393c3")
+    ax.plot(qps, p95, linestyle="none", marker="s", markersize=ms, alpha=0.7, label="p95", color="#d6604d")
+    ax.plot(qps, p99, linestyle="none", marker="^", markersize=ms, alpha=0.7, label="p99", color="#4dac26")
 
     ax.set_xlabel("Actual QPS", fontsize=12)
     ax.set_ylabel("Latency (ms)", fontsize=12)
@@ -599,7 +978,6 @@ def plot_latency_vs_qps(bursts, output_dir):
                  fontsize=14, fontweight="bold")
     ax.legend(loc="best", fontsize=10)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
     _save(fig, output_dir, "03_latency_vs_qps.png")
 
 
@@ -613,16 +991,15 @@ def plot_pod_distribution(snapshots, output_dir):
         print("⚠ No pod placement data, skipping graph 04")
         return
 
-    all_nodes = sorted({n for s in snapshots for n in s["node_counts"]})
+    all_nodes, counts = _node_count_matrix(snapshots)   # [snapshot, node]
     indices = [s["index"] for s in snapshots]
-    node_data = {n: [s["node_counts"].get(n, 0) for s in snapshots] for n in all_nodes}
     short_labels = [short_node(n) for n in all_nodes]
 
     fig, (ax, ax2) = plt.subplots(2, 1, figsize=(14, 8),
-                                   gridspec_kw={"height_ratios": [3, 1]})
+                                   gridspec_kw={"height_ratios": [3, 1]}, layout="constrained")
 
     colors = plt.cm.tab10(np.linspace(0, 0.9, len(all_nodes)))
-    ax.stackplot(indices, *[node_data[n] for n in all_nodes],
+    ax.stackplot(indices, counts.T,
                  labels=short_labels, alpha=0.8, colors=colors)
     ax.set_ylabel("Total pods", fontsize=12)
     ax.set_title("4. Scaling: pod count per node over time\n"
@@ -632,10 +1009,11 @@ def plot_pod_distribution(snapshots, output_dir):
     ax.grid(True, alpha=0.3, axis="y")
 
     # Imbalance ratio: max pods / min pods across nodes (ignoring zeros)
-    ratios = []
-    for s in snapshots:
-        counts = [v for v in s["node_counts"].values() if v > 0]
-        ratios.append(max(counts) / min(counts) if len(counts) >= 2 else 1.0)
+    occupied = counts > 0
+    big      = np.iinfo(counts.dtype).max
+    min_pos  = np.where(occupied, counts, big).min(axis=1, initial=big)
+    max_pos  = counts.max(axis=1, initial=0)
+    ratios = np.where(occupied.sum(axis=1) >= 2, max_pos / np.maximum(min_pos, 1), 1.0)
     ax2.plot(indices, ratios, color="#d6604d", linewidth=2)
     ax2.fill_between(indices, 1, ratios, alpha=0.3, color="#d6604d")
     ax2.axhline(1.0, color="green", linewidth=1, linestyle="--", alpha=0.6, label="Perfect balance")
@@ -645,7 +1023,6 @@ def plot_pod_distribution(snapshots, output_dir):
     ax2.legend(fontsize=9)
     ax2.grid(True, alpha=0.3, axis="y")
 
-    plt.tight_layout()
     _save(fig, output_dir, "04_pod_distribution.png")
 
 
@@ -679,7 +1056,7 @@ def plot_service_placement(placement, output_dir):
         print("⚠ No placement matrix data, skipping graph 05")
         return
 
-    fig, ax = plt.subplots(figsize=(max(9, len(nodes) * 1.6), max(6, len(services) * 0.55)))
+    fig, ax = plt.subplots(figsize=(max(9, len(nodes) * 1.6), max(6, len(services) * 0.55)), layout="constrained")
 
     vmax = max(max(r) for r in data) or 1
     im = ax.imshow(data, cmap="Blues", aspect="auto", vmin=0, vmax=vmax)
@@ -702,7 +1079,6 @@ def plot_service_placement(placement, output_dir):
                 ax.text(j, i, label, ha="center", va="center",
                         color="white" if v >= vmax / 2 else "black", fontsize=9)
 
-    plt.tight_layout()
     _save(fig, output_dir, "05_service_placement_by_node.png")
 
 
@@ -710,32 +1086,22 @@ def plot_service_placement(placement, output_dir):
 # Graph 06 – Latency distribution, split by endpoint
 # ---------------------------------------------------------------------------
 
-def plot_latency_distribution(bursts, output_dir):
+def plot_latency_distribution(bursts_arr, output_dir):
     """Box plots of latency distribution split by endpoint (cart / home / product)."""
-    by_ep = defaultdict(list)
-    for b in bursts:
-        by_ep[b["endpoint"]].append(b)
-
-    endpoints = [e for e in ENDPOINT_ORDER if e in by_ep]
-    if not endpoints:
-        endpoints = sorted(by_ep.keys())
+    endpoints = _endpoints_present(bursts_arr)
 
     n_ep = len(endpoints)
-    fig, axes = plt.subplots(1, n_ep, figsize=(5 * n_ep, 6), sharey=True)
+    fig, axes = plt.subplots(1, n_ep, figsize=(5 * n_ep, 6), sharey=True, layout="constrained")
     if n_ep == 1:
         axes = [axes]
 
     for ax, ep in zip(axes, endpoints):
-        ep_bursts = by_ep[ep]
-        data_by_pct = {
-            "p50":  [b["p50"]  * 1000 for b in ep_bursts],
-            "p95":  [b["p95"]  * 1000 for b in ep_bursts],
-            "p99":  [b["p99"]  * 1000 for b in ep_bursts],
-            "p99.9":[b["p999"] * 1000 for b in ep_bursts],
-        }
+        ep_arr = bursts_arr[bursts_arr["endpoint"] == ep]
+        # (n_bursts, 4) — boxplot draws one box per column
+        data = np.column_stack([ep_arr[k] for k in ("p50", "p95", "p99", "p999")]) * 1000
         colors = ["lightblue", "lightgreen", "lightyellow", "lightcoral"]
-        bp = ax.boxplot(list(data_by_pct.values()),
-                        tick_labels=list(data_by_pct.keys()),
+        bp = ax.boxplot(data,
+                        tick_labels=["p50", "p95", "p99", "p99.9"],
                         patch_artist=True, showmeans=True)
         for patch, color in zip(bp["boxes"], colors):
             patch.set_facecolor(color)
@@ -748,7 +1114,6 @@ def plot_latency_distribution(bursts, output_dir):
     fig.suptitle("6. Latency distribution by endpoint  (box = IQR, whiskers = 1.5×IQR, △ = mean)\n"
                  "Home endpoint shows consistently higher latency — more downstream service calls",
                  fontsize=13, fontweight="bold")
-    plt.tight_layout()
     _save(fig, output_dir, "06_latency_distribution.png")
 
 
@@ -756,6 +1121,33 @@ def plot_latency_distribution(bursts, output_dir):
 # Graph 07 – Cross-node call ratio
 # ---------------------------------------------------------------------------
 
+def _snapshot_svc_node_pods(path):
+    """Return {service: Counter(short node -> pod count)} from one endpoints or pods snapshot."""
+    d = _read_json(path)
+    svc_node_pods = {}
+    for item in d.get("items", []):
+        ns = (item.get("metadata") or {}).get("namespace", "")
+        if ns not in ("", "default"):
+            continue
+        # endpoint format
+        if "subsets" in item:
+            svc = item["metadata"]["name"]
+            for sub in (item.get("subsets") or []):
+                for addr in (sub.get("addresses") or []):
+                    node = (addr.get("nodeName") or "").split(".")[0]
+                    if node:
+                        svc_node_pods.setdefault(svc, Counter())[node] += 1
+        else:
+            # pod format
+            labels = (item.get("metadata") or {}).get("labels", {})
+            app = labels.get("app") or labels.get("app.kubernetes.io/name")
+            node = ((item.get("spec") or {}).get("nodeName") or "").split(".")[0]
+            phase = (item.get("status") or {}).get("phase", "")
+            if app and node and phase == "Running":
+                svc_node_pods.setdefault(app, Counter())[node] += 1
+    return svc_node_pods
+
+
 def _compute_east_west_fractions(network_dir, service_graph_edges):
     """For each edge (caller→target) in the call graph, compute the expected
     cross-node call fraction over time using endpoint placement snapshots.
@@ -769,42 +1161,17 @@ def _compute_east_west_fractions(network_dir, service_graph_edges):
         results: {(caller, target): [fraction_per_snapshot, ...]}
         snapshots: [{svc: {node: count}}]
     """
-    import glob as _glob
-    ep_files = sorted(_glob.glob(os.path.join(network_dir, "service-endpoints-*.json")))
+    ep_files = _list_files(network_dir, "service-endpoints-")
     if not ep_files:
         # fallback to pod-network snapshots
-        ep_files = sorted(_glob.glob(os.path.join(network_dir, "pod-network-*.json")))
+        ep_files = _list_files(network_dir, "pod-network-")
 
     results = defaultdict(list)
     snapshots = []
-    for p in ep_files:
-        try:
-            with open(p) as f:
-                d = json.load(f)
-        except Exception:
+    # Snapshots are parsed in parallel; fractions are folded in file order below
+    for _, svc_node_pods, e in _parse_files(_snapshot_svc_node_pods, ep_files):
+        if e is not None:
             continue
-        svc_node_pods = defaultdict(lambda: defaultdict(int))
-        for item in d.get("items", []):
-            ns = (item.get("metadata") or {}).get("namespace", "")
-            if ns not in ("", "default"):
-                continue
-            # endpoint format
-            if "subsets" in item:
-                svc = item["metadata"]["name"]
-                for sub in (item.get("subsets") or []):
-                    for addr in (sub.get("addresses") or []):
-                        node = (addr.get("nodeName") or "").split(".")[0]
-                        if node:
-                            svc_node_pods[svc][node] += 1
-            else:
-                # pod format
-                labels = (item.get("metadata") or {}).get("labels", {})
-                app = labels.get("app") or labels.get("app.kubernetes.io/name")
-                node = ((item.get("spec") or {}).get("nodeName") or "").split(".")[0]
-                phase = (item.get("status") or {}).get("phase", "")
-                if app and node and phase == "Running":
-                    svc_node_pods[app][node] += 1
-
         snapshots.append(svc_node_pods)
 
         for caller, target in service_graph_edges:
@@ -826,19 +1193,24 @@ def _compute_east_west_fractions(network_dir, service_graph_edges):
     return results, snapshots
 
 
-def plot_cross_node_ratio(s2s_records, service_to_nodes, output_dir,
-                          from_loadgen_only=False, network_dir=None, service_graph_edges=None):
+def plot_cross_node_ratio(s2s, service_to_nodes, output_dir,
+                          from_loadgen_only=False, network_dir=None, service_graph_edges=None,
+                          fractions=None):
     """Graph 07: East-west cross-node fraction per service-to-service call edge.
 
     Uses the actual application call graph (not the prober) overlaid on
     Kubernetes endpoint placement to show what fraction of each RPC type
     crosses the east-west fabric under uniform K8s load balancing.
+    Pass precomputed ``fractions`` (from _compute_east_west_fractions) to
+    skip re-reading the placement snapshots.
     """
     if not service_graph_edges or not network_dir:
         print("⚠ No service graph / network_dir, skipping graph 07")
         return
 
-    results, _ = _compute_east_west_fractions(network_dir, service_graph_edges)
+    results = fractions
+    if results is None:
+        results, _ = _compute_east_west_fractions(network_dir, service_graph_edges)
     if not results:
         print("⚠ No east-west data computed, skipping graph 07")
         return
@@ -856,7 +1228,7 @@ def plot_cross_node_ratio(s2s_records, service_to_nodes, output_dir,
 
     # Horizontal bar chart — Y-axis has room for long labels, no rotation needed
     n = len(labels)
-    fig, ax = plt.subplots(figsize=(9, max(5, n * 0.42)))
+    fig, ax = plt.subplots(figsize=(9, max(5, n * 0.42)), layout="constrained")
     y_pos = range(n)
 
     bars = ax.barh(y_pos, ratios, color=colors, alpha=0.88, height=0.65)
@@ -880,7 +1252,6 @@ def plot_cross_node_ratio(s2s_records, service_to_nodes, output_dir,
         fontsize=10, fontweight="bold")
     ax.legend(fontsize=9, loc="lower right")
     ax.grid(True, alpha=0.3, axis="x")
-    plt.tight_layout()
     _save(fig, output_dir, "07_cross_node_ratio.png")
 
 
@@ -888,9 +1259,9 @@ def plot_cross_node_ratio(s2s_records, service_to_nodes, output_dir,
 # Graph 08 – Same-node vs cross-node latency CDF
 # ---------------------------------------------------------------------------
 
-def plot_same_vs_cross_node_cdf(s2s_records, service_to_nodes, output_dir,
+def plot_same_vs_cross_node_cdf(s2s, service_to_nodes, output_dir,
                                 from_loadgen_only=False, network_dir=None,
-                                service_graph_edges=None):
+                                service_graph_edges=None, fractions=None):
     """Graph 08: East-west traffic fraction timeline.
 
     Shows how the expected cross-node call fraction evolves over the experiment
@@ -901,9 +1272,9 @@ def plot_same_vs_cross_node_cdf(s2s_records, service_to_nodes, output_dir,
         print("⚠ No service graph / network_dir, skipping graph 08")
         return
 
-    import glob as _glob
-
-    results, _ = _compute_east_west_fractions(network_dir, service_graph_edges)
+    results = fractions
+    if results is None:
+        results, _ = _compute_east_west_fractions(network_dir, service_graph_edges)
     if not results:
         print("⚠ No east-west timeline data, skipping graph 08")
         return
@@ -931,7 +1302,7 @@ def plot_same_vs_cross_node_cdf(s2s_records, service_to_nodes, output_dir,
     xs = list(range(n_snaps))
 
     fig, axes = plt.subplots(1, 2, figsize=(16, 7),
-                              gridspec_kw={"width_ratios": [3, 1]})
+                              gridspec_kw={"width_ratios": [3, 1]}, layout="constrained")
     ax_main, ax_bar = axes
 
     # Main panel: dynamic edges over time
@@ -987,9 +1358,6 @@ def plot_same_vs_cross_node_cdf(s2s_records, service_to_nodes, output_dir,
         "(Computed from call graph + K8s endpoint snapshots; assumes uniform load balancing)",
         fontsize=11, fontweight="bold"
     )
-    plt.tight_layout()
-    # Extra bottom margin for the below-axis legend
-    fig.subplots_adjust(bottom=0.18)
     _save(fig, output_dir, "08_same_vs_cross_node_cdf.png")
 
 
@@ -997,32 +1365,21 @@ def plot_same_vs_cross_node_cdf(s2s_records, service_to_nodes, output_dir,
 # Graph 09 – p95 vs replica count scatter
 # ---------------------------------------------------------------------------
 
-def plot_p95_vs_replicas(latency_replicas_rows, output_dir):
-    if not latency_replicas_rows:
+def plot_p95_vs_replicas(replica_cols, output_dir):
+    p95 = replica_cols["s2s_p95_ms"]
+    if not len(p95):
         print("⚠ No latency-vs-replicas data, skipping graph 09")
         return
-    total_replicas, p95_vals = [], []
-    for row in latency_replicas_rows:
-        p95_str = row.get("s2s_p95_ms", "")
-        if not p95_str:
-            continue
-        try:
-            p95 = float(p95_str)
-        except ValueError:
-            continue
-        # Skip near-zero values — these come from gRPC health probes that respond in <1ms
-        # and don't reflect real application latency; they skew the scatter to the bottom.
-        if p95 < 10:
-            continue
-        cur = sum(int(v) for k, v in row.items()
-                  if k.endswith("_current") and v and v.isdigit())
-        if cur > 0:
-            total_replicas.append(cur)
-            p95_vals.append(p95)
-    if not total_replicas:
+    # Skip near-zero values — these come from gRPC health probes that respond in <1ms
+    # and don't reflect real application latency; they skew the scatter to the bottom.
+    # (NaN, i.e. missing p95, fails the comparison too.)
+    keep = (p95 >= 10) & (replica_cols["total_replicas"] > 0)
+    total_replicas = replica_cols["total_replicas"][keep]
+    p95_vals       = p95[keep]
+    if not len(total_replicas):
         print("⚠ No data points for graph 09")
         return
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
     sc = ax.scatter(total_replicas, p95_vals, c=range(len(total_replicas)),
                     cmap="plasma", alpha=0.75, s=60, edgecolors="none")
     plt.colorbar(sc, ax=ax, label="Time order (darker = earlier)")
@@ -1032,7 +1389,6 @@ def plot_p95_vs_replicas(latency_replicas_rows, output_dir):
                  f"Replicas: {min(total_replicas)}–{max(total_replicas)}",
                  fontsize=13, fontweight="bold")
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
     _save(fig, output_dir, "09_p95_vs_replicas.png")
 
 
@@ -1040,28 +1396,19 @@ def plot_p95_vs_replicas(latency_replicas_rows, output_dir):
 # Graph 09b – p95 vs node count
 # ---------------------------------------------------------------------------
 
-def plot_p95_vs_node_count(latency_replicas_rows, output_dir):
-    node_counts, p95_vals = [], []
-    for row in latency_replicas_rows:
-        nc_s = row.get("node_count", "").strip()
-        p95_s = row.get("s2s_p95_ms", "").strip()
-        if not nc_s or not p95_s:
-            continue
-        try:
-            nc, p95 = int(nc_s), float(p95_s)
-        except ValueError:
-            continue
-        if nc > 0:
-            node_counts.append(nc)
-            p95_vals.append(p95)
-    if not node_counts:
+def plot_p95_vs_node_count(replica_cols, output_dir):
+    nc, p95 = replica_cols["node_count"], replica_cols["s2s_p95_ms"]
+    keep = (nc > 0) & ~np.isnan(p95)
+    node_counts = nc[keep].astype(np.int64)
+    p95_vals    = p95[keep]
+    if not len(node_counts):
         print("⚠ No node_count data, skipping graph 09b")
         return
     nc_min, nc_max = min(node_counts), max(node_counts)
     if nc_min == nc_max:
         print(f"⚠ Skipping graph 09b: node count is constant ({nc_min}) in this run")
         return
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
     sc = ax.scatter(node_counts, p95_vals, c=range(len(node_counts)),
                     cmap="viridis", alpha=0.75, s=60, edgecolors="none")
     plt.colorbar(sc, ax=ax, label="Time order")
@@ -1071,7 +1418,6 @@ def plot_p95_vs_node_count(latency_replicas_rows, output_dir):
                  f"Node count range: {nc_min}–{nc_max}",
                  fontsize=13, fontweight="bold")
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
     _save(fig, output_dir, "09b_p95_vs_node_count.png")
 
 
@@ -1079,29 +1425,24 @@ def plot_p95_vs_node_count(latency_replicas_rows, output_dir):
 # Graph 10 – Node-pair p95 heatmap
 # ---------------------------------------------------------------------------
 
-def plot_node_pair_heatmap(s2s_records, output_dir, from_loadgen_only=False):
-    if not s2s_records:
+def plot_node_pair_heatmap(s2s, output_dir, from_loadgen_only=False):
+    if not len(s2s):
         print("⚠ No s2s data, skipping graph 10")
         return
-    pair_latencies = defaultdict(list)
-    for rec in s2s_records:
-        total = rec.get("total")
-        sn = rec.get("source_node", "unknown")
-        ts = rec.get("target_service", "unknown")
-        if total is not None and sn != "unknown":
-            pair_latencies[(sn, ts)].append(total)
-    if not pair_latencies:
+    keep = ~np.isnan(s2s["total"]) & (s2s["source_node"] != "unknown")
+    if not keep.any():
         print("⚠ No data for graph 10")
         return
-    src_nodes = sorted({k[0] for k in pair_latencies})
-    tgt_svcs  = sorted({k[1] for k in pair_latencies})
-    matrix = np.full((len(src_nodes), len(tgt_svcs)), np.nan)
-    for i, sn in enumerate(src_nodes):
-        for j, ts in enumerate(tgt_svcs):
-            vals = sorted(pair_latencies.get((sn, ts), []))
-            if vals:
-                matrix[i][j] = vals[min(int(len(vals) * 0.95), len(vals) - 1)]
-    fig, ax = plt.subplots(figsize=(max(10, len(tgt_svcs) * 0.9), max(4, len(src_nodes) * 0.9)))
+    s2s = s2s[keep]
+    src_nodes, src_idx = np.unique(s2s["source_node"], return_inverse=True)
+    tgt_svcs,  tgt_idx = np.unique(s2s["target_service"], return_inverse=True)
+    src_nodes, tgt_svcs = src_nodes.tolist(), tgt_svcs.tolist()
+    # One flat cell id per record; p95 per cell in a single grouped pass
+    cells, p95s = _group_p95(src_idx * len(tgt_svcs) + tgt_idx, s2s["total"])
+    matrix = np.full(len(src_nodes) * len(tgt_svcs), np.nan)
+    matrix[cells] = p95s
+    matrix = matrix.reshape(len(src_nodes), len(tgt_svcs))
+    fig, ax = plt.subplots(figsize=(max(10, len(tgt_svcs) * 0.9), max(4, len(src_nodes) * 0.9)), layout="constrained")
     masked = np.ma.masked_invalid(matrix)
     im = ax.imshow(masked, cmap="YlOrRd", aspect="auto")
     plt.colorbar(im, ax=ax, label="p95 latency (ms)")
@@ -1115,13 +1456,11 @@ def plot_node_pair_heatmap(s2s_records, output_dir, from_loadgen_only=False):
     title += " (load generator)" if from_loadgen_only else " (client prober → service)"
     ax.set_title(title, fontsize=13, fontweight="bold")
     vmax = np.nanmax(matrix) if not np.all(np.isnan(matrix)) else 1
-    for i in range(len(src_nodes)):
-        for j in range(len(tgt_svcs)):
-            v = matrix[i][j]
-            if not np.isnan(v):
-                ax.text(j, i, f"{v:.0f}", ha="center", va="center",
-                        fontsize=7, color="white" if v > vmax * 0.6 else "black")
-    plt.tight_layout()
+    # Annotate only populated cells (row-major order, same as the matrix fill)
+    for i, j in np.argwhere(~np.isnan(matrix)).tolist():
+        v = matrix[i, j]
+        ax.text(j, i, f"{v:.0f}", ha="center", va="center",
+                fontsize=7, color="white" if v > vmax * 0.6 else "black")
     _save(fig, output_dir, "10_node_pair_latency_heatmap.png")
 
 
@@ -1129,63 +1468,62 @@ def plot_node_pair_heatmap(s2s_records, output_dir, from_loadgen_only=False):
 # Graph 10b – Latency to each service by source node (annotates gRPC failures)
 # ---------------------------------------------------------------------------
 
-def _is_grpc_probe_failure(latencies, codes, is_grpc_flags=None):
-    """True if the probe could not reach this service.
+def _probe_failure_mask(pair, latencies, codes, is_grpc, n_pairs):
+    """Per (source node, service) pair: True if the probe could not reach the service.
 
     HTTP probes: success = code 200. Failures show code=000 and total≈5000ms (curl timeout).
     gRPC probes: success = code 0 (gRPC OK). Non-zero codes are real gRPC errors, not timeouts.
-    If is_grpc_flags is provided (list of bool), use it to determine probe type per record.
+    A pair is treated as gRPC when most of its records carry grpc=1; `codes` is NaN
+    where a record had no numeric code.
     """
-    if not latencies:
-        return False
-    # Determine if this service's probes are gRPC or HTTP
-    is_grpc = bool(is_grpc_flags and sum(is_grpc_flags) > len(is_grpc_flags) / 2)
-    if codes:
-        if is_grpc:
-            # gRPC OK = code 0; anything else is a real error
-            pct_fail = sum(1 for c in codes if int(c) != 0) / len(codes)
-        else:
-            # HTTP: code 200 = success; code 000 = curl timeout / connection refused
-            pct_fail = sum(1 for c in codes if int(c) not in (200, 201, 204)) / len(codes)
-        return pct_fail > 0.85
+    n = np.bincount(pair, minlength=n_pairs)
+    grpc = np.bincount(pair, weights=is_grpc, minlength=n_pairs) > n / 2
+    has_code = ~np.isnan(codes)
+    n_codes = np.bincount(pair, weights=has_code, minlength=n_pairs)
+    code = np.trunc(codes)
+    # gRPC OK = code 0; HTTP code 000 = curl timeout / connection refused
+    bad = has_code & np.where(grpc[pair], code != 0, ~np.isin(code, (200, 201, 204)))
+    n_bad = np.bincount(pair, weights=bad, minlength=n_pairs)
     # Fallback: latency-based heuristic (HTTP curl timeout = 5000ms)
-    if not is_grpc:
-        pct_timeout = sum(1 for v in latencies if v > 4990) / len(latencies)
-        return pct_timeout > 0.85
-    return False
+    n_timeout = np.bincount(pair, weights=latencies > 4990, minlength=n_pairs)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n_codes > 0, n_bad / n_codes > 0.85, ~grpc & (n_timeout / n > 0.85))
 
 
-def plot_latency_to_service_by_node(s2s_records, output_dir, from_loadgen_only=False):
-    if not s2s_records:
+def plot_latency_to_service_by_node(s2s, output_dir, from_loadgen_only=False):
+    if not len(s2s):
         print("⚠ No s2s data, skipping graph 10b")
         return
 
-    pair_latencies = defaultdict(list)
-    pair_codes     = defaultdict(list)
-    pair_is_grpc   = defaultdict(list)
-    for rec in s2s_records:
-        total = rec.get("total")
-        sn = rec.get("source_node", "unknown")
-        ts = rec.get("target_service", "unknown")
-        code = rec.get("code")
-        if total is not None and sn != "unknown" and ts:
-            pair_latencies[(sn, ts)].append(total)
-            pair_is_grpc[(sn, ts)].append(rec.get("is_grpc", False))
-            if code is not None:
-                pair_codes[(sn, ts)].append(code)
-    if not pair_latencies:
+    keep = (~np.isnan(s2s["total"]) & (s2s["source_node"] != "unknown")
+            & s2s["target_service"].astype(bool))
+    if not keep.any():
         print("⚠ No data for graph 10b")
         return
-
-    src_nodes = sorted({k[0] for k in pair_latencies})
-    tgt_svcs  = [s for s in BOUTIQUE_SERVICES if s in {k[1] for k in pair_latencies}]
+    s2s = s2s[keep]
+    src_nodes, src_idx = np.unique(s2s["source_node"], return_inverse=True)
+    svcs,      svc_idx = np.unique(s2s["target_service"], return_inverse=True)
+    n_src, n_svc = len(src_nodes), len(svcs)
+    # One flat pair id per record; p95 and probe-failure verdict per pair in grouped passes
+    pair = src_idx * n_svc + svc_idx
+    totals = s2s["total"]
+    cells, p95s = _group_p95(pair, totals)
+    p95_grid = np.full(n_src * n_svc, np.nan)
+    p95_grid[cells] = p95s
+    p95_grid = p95_grid.reshape(n_src, n_svc)
+    failed = _probe_failure_mask(pair, totals, s2s["code"], s2s["is_grpc"], n_src * n_svc)
+    svc_failed = failed.reshape(n_src, n_svc).any(axis=0)
+    svc_col = {s: j for j, s in enumerate(svcs.tolist())}
+    node_labels = [short_node(sn) for sn in src_nodes.tolist()]
+
+    tgt_svcs = [s for s in BOUTIQUE_SERVICES if s in svc_col]
     if not tgt_svcs:
-        tgt_svcs = sorted({k[1] for k in pair_latencies})
+        tgt_svcs = sorted(svc_col)
 
     n_s = len(tgt_svcs)
     n_cols = min(4, n_s)
     n_rows = (n_s + n_cols - 1) // n_cols
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(4.5 * n_cols, 3.8 * n_rows))
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(4.5 * n_cols, 3.8 * n_rows), layout="constrained")
     if n_s == 1:
         axes = np.array([axes])
     axes = axes.flatten()
@@ -1194,25 +1532,17 @@ def plot_latency_to_service_by_node(s2s_records, output_dir, from_loadgen_only=F
     title_base += " (load generator)" if from_loadgen_only else " (client prober → service)"
     fig.suptitle(title_base +
                  "\nGrey panels: gRPC services cannot be probed via HTTP — deploy gRPC prober",
-                 fontsize=12, fontweight="bold", y=1.02)
+                 fontsize=12, fontweight="bold")
 
     for idx, ts in enumerate(tgt_svcs):
         ax = axes[idx]
-        node_p95, labels, is_failure = [], [], False
-        for sn in src_nodes:
-            vals = pair_latencies.get((sn, ts), [])
-            codes = pair_codes.get((sn, ts), [])
-            grpc_flags = pair_is_grpc.get((sn, ts), [])
-            if vals:
-                fail = _is_grpc_probe_failure(vals, codes, grpc_flags)
-                if fail:
-                    is_failure = True
-                    break
-                p95 = sorted(vals)[min(int(len(vals) * 0.95), len(vals) - 1)]
-                node_p95.append(p95)
-                labels.append(short_node(sn))
-
-        if is_failure or not node_p95:
+        j = svc_col[ts]
+        is_failure = svc_failed[j]
+        present = ~np.isnan(p95_grid[:, j])
+        node_p95 = p95_grid[present, j]
+        labels = [lbl for lbl, ok in zip(node_labels, present) if ok]
+
+        if is_failure or not labels:
             ax.set_facecolor("#f0f0f0")
             ax.text(0.5, 0.6, ts, ha="center", va="center",
                     transform=ax.transAxes, fontsize=11, fontweight="bold", color="#333")
@@ -1236,7 +1566,6 @@ def plot_latency_to_service_by_node(s2s_records, output_dir, from_loadgen_only=F
 
     for j in range(n_s, len(axes)):
         axes[j].set_visible(False)
-    plt.tight_layout()
     _save(fig, output_dir, "10b_latency_to_service_by_node.png")
 
 
@@ -1244,32 +1573,29 @@ def plot_latency_to_service_by_node(s2s_records, output_dir, from_loadgen_only=F
 # Graph 11 – Queueing vs RTT decomposition
 # ---------------------------------------------------------------------------
 
-def plot_queueing_vs_rtt(s2s_records, output_dir, from_loadgen_only=False):
-    if not s2s_records:
+def _s2s_ok_mask(s2s):
+    """Successful probes (HTTP code 200, gRPC code 0); a probe without a code counts as success."""
+    code = s2s["code"]
+    return np.isnan(code) | (np.trunc(code) == np.where(s2s["is_grpc"], 0, 200))
+
+
+def plot_queueing_vs_rtt(s2s, output_dir, from_loadgen_only=False):
+    if not len(s2s):
         print("⚠ No s2s data, skipping graph 11")
         return
-    # Only successful probes (HTTP code 200, gRPC code 0)
-    by_ts = defaultdict(lambda: {"connect": [], "queueing": []})
-    for rec in s2s_records:
-        code = rec.get("code")
-        if code is not None:
-            ok_code = 0 if rec.get("is_grpc") else 200
-            if int(code) != ok_code:
-                continue
-        connect = rec.get("connect")
-        ttfb    = rec.get("ttfb")
-        ts      = rec.get("timestamp", "")
-        if connect is not None and ttfb is not None and connect >= 0:
-            q = ttfb - connect
-            if q >= 0:
-                by_ts[ts]["connect"].append(connect)
-                by_ts[ts]["queueing"].append(q)
-    if not by_ts:
+    # Missing metrics are NaN, which fails every comparison below
+    ts       = s2s["timestamp"]
+    connect  = s2s["connect"]
+    queueing = s2s["ttfb"] - connect
+    keep = _s2s_ok_mask(s2s) & (connect >= 0) & (queueing >= 0)
+    if not keep.any():
         print("⚠ No connect/ttfb data for graph 11")
         return
-    sorted_ts = sorted(by_ts)
-    mean_connect  = [np.mean(by_ts[ts]["connect"])  for ts in sorted_ts]
-    mean_queueing = [np.mean(by_ts[ts]["queueing"]) for ts in sorted_ts]
+    # Per-timestamp means: group ids from np.unique, sums via bincount
+    sorted_ts, inv = np.unique(ts[keep], return_inverse=True)
+    per_ts = np.bincount(inv)
+    mean_connect  = np.bincount(inv, weights=connect[keep])  / per_ts
+    mean_queueing = np.bincount(inv, weights=queueing[keep]) / per_ts
     x = range(len(sorted_ts))
 
     title = "11. Decomposition: network RTT vs server queueing delay over time"
@@ -1277,10 +1603,10 @@ def plot_queueing_vs_rtt(s2s_records, output_dir, from_loadgen_only=False):
 
     # Clamp zeros to a small positive value so log scale works on stackplot
     eps = 0.01
-    mean_connect_log  = [max(v, eps) for v in mean_connect]
-    mean_queueing_log = [max(v, eps) for v in mean_queueing]
+    mean_connect_log  = np.maximum(mean_connect, eps)
+    mean_queueing_log = np.maximum(mean_queueing, eps)
 
-    fig, ax = plt.subplots(figsize=(14, 6))
+    fig, ax = plt.subplots(figsize=(14, 6), layout="constrained")
     ax.stackplot(x, mean_connect_log, mean_queueing_log,
                  labels=["Network RTT (connect, includes DNS)",
                          "Server queueing delay (ttfb − connect)"],
@@ -1293,7 +1619,6 @@ def plot_queueing_vs_rtt(s2s_records, output_dir, from_loadgen_only=False):
                  fontsize=12, fontweight="bold")
     ax.legend(loc="upper left", fontsize=10)
     ax.grid(True, alpha=0.3, which="both", axis="y")
-    plt.tight_layout()
     _save(fig, output_dir, "11_queueing_vs_rtt.png")
 
 
@@ -1301,36 +1626,27 @@ def plot_queueing_vs_rtt(s2s_records, output_dir, from_loadgen_only=False):
 # Graph 11b – Network RTT time-series + CDF (bimodal split)
 # ---------------------------------------------------------------------------
 
-def plot_network_rtt_only(s2s_records, output_dir, from_loadgen_only=False):
-    if not s2s_records:
+def plot_network_rtt_only(s2s, output_dir, from_loadgen_only=False):
+    if not len(s2s):
         print("⚠ No s2s data, skipping graph 11b")
         return
-    by_ts     = defaultdict(list)
-    all_conns = []
-    for rec in s2s_records:
-        code = rec.get("code")
-        if code is not None:
-            ok_code = 0 if rec.get("is_grpc") else 200
-            if int(code) != ok_code:
-                continue
-        c  = rec.get("connect")
-        ts = rec.get("timestamp", "")
-        if c is not None and c >= 0 and ts:
-            by_ts[ts].append(c)
-            all_conns.append(c)
-    if not by_ts:
+    ts      = s2s["timestamp"]
+    connect = s2s["connect"]
+    keep = _s2s_ok_mask(s2s) & (connect >= 0) & ts.astype(bool)
+    if not keep.any():
         print("⚠ No connect data for graph 11b")
         return
 
-    sorted_ts    = sorted(by_ts)
-    mean_connect = [np.mean(by_ts[ts]) for ts in sorted_ts]
+    all_conns = connect[keep]
+    sorted_ts, inv = np.unique(ts[keep], return_inverse=True)
+    mean_connect = np.bincount(inv, weights=all_conns) / np.bincount(inv)
     x            = range(len(sorted_ts))
 
     title = "11b. Connection time: time-series (left) and CDF (right)"
     title += " (load generator)" if from_loadgen_only else " (client prober → service)"
 
     fig, (ax_ts, ax_cdf) = plt.subplots(1, 2, figsize=(16, 5),
-                                         gridspec_kw={"width_ratios": [2, 1]})
+                                         gridspec_kw={"width_ratios": [2, 1]}, layout="constrained")
 
     # Time-series
     ax_ts.fill_between(x, mean_connect, alpha=0.4, color="#4393c3")
@@ -1344,11 +1660,11 @@ def plot_network_rtt_only(s2s_records, output_dir, from_loadgen_only=False):
     ax_ts.set_ylim(0, None)
 
     # CDF with bimodal annotation
-    if all_conns:
+    if len(all_conns):
         sv = np.sort(all_conns)
-        ax_cdf.plot(sv, np.arange(1, len(sv) + 1) / len(sv),
-                    color="#2166ac", linewidth=2.5)
-        pct_fast = sum(1 for v in all_conns if v < 5) / len(all_conns) * 100
+        ax_cdf.plot(*_cdf_points(sv), color="#2166ac", linewidth=2.5)
+        # sv is sorted, so the < 5 ms count is a binary search, not a scan
+        pct_fast = np.searchsorted(sv, 5) / len(sv) * 100
         pct_slow = 100 - pct_fast
         ax_cdf.axvline(5, color="orange", linestyle="--", linewidth=1.5, alpha=0.7,
                        label="5 ms threshold")
@@ -1368,7 +1684,6 @@ def plot_network_rtt_only(s2s_records, output_dir, from_loadgen_only=False):
     fig.suptitle(title + "\n(Bimodal: fast mode = cached/same-node; slow mode = CoreDNS "
                  "resolution under load — not pure TCP RTT)",
                  fontsize=12, fontweight="bold")
-    plt.tight_layout()
     _save(fig, output_dir, "11b_network_rtt_only.png")
 
 
@@ -1376,25 +1691,23 @@ def plot_network_rtt_only(s2s_records, output_dir, from_loadgen_only=False):
 # NEW Graph 12 – Connection-time CDF from fortio ConnectionStats
 # ---------------------------------------------------------------------------
 
-def plot_connect_time_cdf(bursts, output_dir):
+def plot_connect_time_cdf(bursts_arr, output_dir):
     """CDF of TCP connection establishment time from the s2s HTTP prober (fortio ConnectionStats).
     Reveals bimodal distribution: fast same-node/cached-DNS vs slow live-DNS mode.
     k6 load-test bursts don't carry connection timing, so this graph always uses prober data.
     """
-    all_times = []
-    for b in bursts:
-        all_times.extend(b.get("conn_times_ms", []))
+    all_times = [t for times in bursts_arr["conn_times_ms"] for t in times]
     if not all_times:
         # Fall back: use conn_p50 / conn_p95 markers if raw times not available
         print("⚠ No ConnectionStats data for graph 12 (using marker approach)")
-        fig, ax = plt.subplots(figsize=(8, 5))
-        vals = [(b["conn_p50_ms"], b["conn_p95_ms"]) for b in bursts
-                if b.get("conn_p50_ms") and b.get("conn_p95_ms")]
-        if not vals:
+        fig, ax = plt.subplots(figsize=(8, 5), layout="constrained")
+        p50s = np.nan_to_num(bursts_arr["conn_p50_ms"])
+        p95s = np.nan_to_num(bursts_arr["conn_p95_ms"])
+        have = (p50s != 0) & (p95s != 0)
+        if not have.any():
             plt.close(fig)
             return
-        p50s = [v[0] for v in vals]
-        p95s = [v[1] for v in vals]
+        p50s, p95s = p50s[have], p95s[have]
         ax.scatter(range(len(p50s)), p50s, label="conn p50 (ms)", s=40, color="#2166ac")
         ax.scatter(range(len(p95s)), p95s, label="conn p95 (ms)", s=40, color="#d6604d", marker="s")
         ax.set_xlabel("Burst index", fontsize=12)
@@ -1403,11 +1716,10 @@ def plot_connect_time_cdf(bursts, output_dir):
                      fontsize=13, fontweight="bold")
         ax.legend()
         ax.grid(True, alpha=0.3)
-        plt.tight_layout()
         _save(fig, output_dir, "12_connect_time_cdf.png")
         return
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5), layout="constrained")
 
     # Histogram
     bins = np.logspace(np.log10(max(min(all_times), 0.01)), np.log10(max(all_times) + 1), 60)
@@ -1418,7 +1730,8 @@ def plot_connect_time_cdf(bursts, output_dir):
     ax1.set_title("Distribution (log-scale X reveals bimodal split)", fontsize=11)
     ax1.axvline(5, color="orange", linestyle="--", linewidth=1.5,
                 label="5 ms threshold", alpha=0.8)
-    fast = sum(1 for v in all_times if v < 5)
+    sv = np.sort(all_times)
+    fast = int(np.searchsorted(sv, 5))   # count of samples < 5 ms
     slow = len(all_times) - fast
     ax1.text(0.05, 0.92, f"< 5 ms:  {fast} ({fast/len(all_times)*100:.0f}%)\n"
              f"≥ 5 ms:  {slow} ({slow/len(all_times)*100:.0f}%)",
@@ -1428,8 +1741,7 @@ def plot_connect_time_cdf(bursts, output_dir):
     ax1.grid(True, alpha=0.3, axis="y")
 
     # CDF
-    sv = np.sort(all_times)
-    ax2.plot(sv, np.arange(1, len(sv) + 1) / len(sv), color="#2166ac", linewidth=2.5)
+    ax2.plot(*_cdf_points(sv), color="#2166ac", linewidth=2.5)
     ax2.axvline(5, color="orange", linestyle="--", linewidth=1.5, alpha=0.8)
     pct_fast = fast / len(all_times)
     ax2.annotate(f"← {pct_fast*100:.0f}%\n  fast\n  (< 5 ms)",
@@ -1445,7 +1757,6 @@ def plot_connect_time_cdf(bursts, output_dir):
                  "Bimodal: fast mode = cached DNS / same-node path; "
                  "slow mode = live CoreDNS resolution under load",
                  fontsize=13, fontweight="bold")
-    plt.tight_layout()
     _save(fig, output_dir, "12_connect_time_cdf.png")
 
 
@@ -1453,45 +1764,30 @@ def plot_connect_time_cdf(bursts, output_dir):
 # NEW Graph 13 – HPA replica count + per-endpoint latency dual-axis timeline
 # ---------------------------------------------------------------------------
 
-def plot_hpa_latency_timeline(bursts, latency_replicas_rows, output_dir):
+def plot_hpa_latency_timeline(bursts_arr, replica_cols, output_dir):
     """Dual-axis: per-endpoint p95 latency (left) and HPA total replicas (right)
     over burst index. Marks when HPA reached its ceiling.
     """
-    if not bursts:
+    if not len(bursts_arr):
         return
 
-    by_ep = defaultdict(dict)
-    for b in bursts:
-        by_ep[b["endpoint"]][b["index"]] = b["p95"] * 1000
-
-    endpoints = [e for e in ENDPOINT_ORDER if e in by_ep]
-    if not endpoints:
-        endpoints = sorted(by_ep.keys())
-    all_idx = sorted({b["index"] for b in bursts})
+    endpoints = _endpoints_present(bursts_arr)
 
     # Total replicas per HPA snapshot row
-    hpa_total = []
-    for row in latency_replicas_rows:
-        cur = sum(int(v) for k, v in row.items()
-                  if k.endswith("_current") and v and v.isdigit())
-        hpa_total.append(cur)
+    hpa_total = replica_cols["total_replicas"]
     # Find when HPA stabilized (first time total replicas reach max)
     hpa_ceil_idx = None
-    if hpa_total:
-        max_rep = max(hpa_total)
-        for i, v in enumerate(hpa_total):
-            if v >= max_rep:
-                hpa_ceil_idx = i
-                break
+    if len(hpa_total):
+        max_rep = hpa_total.max()
+        hpa_ceil_idx = int(np.argmax(hpa_total >= max_rep))
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 9),
-                                    gridspec_kw={"height_ratios": [1.6, 1]})
+                                    gridspec_kw={"height_ratios": [1.6, 1]}, layout="constrained")
 
     # ── Top panel: per-endpoint p95 latency vs burst index ──────────────────
     for ep in endpoints:
-        idx_map = by_ep[ep]
-        idx_list = sorted(idx_map)
-        vals = [idx_map[i] for i in idx_list]
+        ep_arr = bursts_arr[bursts_arr["endpoint"] == ep]
+        idx_list, vals = _last_per_index(ep_arr["index"], ep_arr["p95"] * 1000)
         ax1.plot(idx_list, vals, "o-", color=ENDPOINT_COLORS.get(ep, "#444"),
                  linewidth=2, markersize=5, label=f"/{ep} p95")
 
@@ -1505,7 +1801,7 @@ def plot_hpa_latency_timeline(bursts, latency_replicas_rows, output_dir):
     ax1.grid(True, alpha=0.3)
 
     # ── Bottom panel: HPA total replicas vs snapshot index ──────────────────
-    if hpa_total:
+    if len(hpa_total):
         hpa_x = np.arange(len(hpa_total))
         ax2.bar(hpa_x, hpa_total, color="#aaaaaa", alpha=0.55, width=1.0,
                 label="Total replicas (HPA)")
@@ -1523,7 +1819,6 @@ def plot_hpa_latency_timeline(bursts, latency_replicas_rows, output_dir):
         ax2.text(0.5, 0.5, "No HPA snapshot data", ha="center", va="center",
                  transform=ax2.transAxes, fontsize=12, color="#888")
 
-    plt.tight_layout()
     _save(fig, output_dir, "13_hpa_latency_timeline.png")
 
 
@@ -1531,17 +1826,11 @@ def plot_hpa_latency_timeline(bursts, latency_replicas_rows, output_dir):
 # NEW Graph 14 – Per-endpoint latency boxplot comparison
 # ---------------------------------------------------------------------------
 
-def plot_per_endpoint_latency(bursts, output_dir):
+def plot_per_endpoint_latency(bursts_arr, output_dir):
     """Grouped boxplot comparing cart / home / product latency side-by-side.
     Shows that home is consistently worse due to deeper service call chain.
     """
-    by_ep = defaultdict(list)
-    for b in bursts:
-        by_ep[b["endpoint"]].append(b)
-
-    endpoints = [e for e in ENDPOINT_ORDER if e in by_ep]
-    if not endpoints:
-        endpoints = sorted(by_ep.keys())
+    endpoints = _endpoints_present(bursts_arr)
     if len(endpoints) < 2:
         print("⚠ Only one endpoint found, skipping graph 14")
         return
@@ -1551,17 +1840,17 @@ def plot_per_endpoint_latency(bursts, output_dir):
     n_pct = len(percentile_keys)
     n_ep  = len(endpoints)
 
-    fig, ax = plt.subplots(figsize=(4 * n_pct, 6))
+    fig, ax = plt.subplots(figsize=(4 * n_pct, 6), layout="constrained")
 
     width  = 0.8 / n_ep
     x_base = np.arange(n_pct)
 
     for k, ep in enumerate(endpoints):
-        ep_bursts = by_ep[ep]
+        ep_arr = bursts_arr[bursts_arr["endpoint"] == ep]
         c = ENDPOINT_COLORS.get(ep, "#666")
         offset = (k - (n_ep - 1) / 2) * width
         positions = x_base + offset
-        data = [[b[pk] * 1000 for b in ep_bursts] for pk in percentile_keys]
+        data = [ep_arr[pk] * 1000 for pk in percentile_keys]
         bp = ax.boxplot(data, positions=positions, widths=width * 0.85,
                         patch_artist=True, showmeans=True,
                         medianprops=dict(color="black", linewidth=2),
@@ -1582,7 +1871,6 @@ def plot_per_endpoint_latency(bursts, output_dir):
                  fontsize=13, fontweight="bold")
     ax.legend(loc="upper left", fontsize=11)
     ax.grid(True, alpha=0.3, axis="y")
-    plt.tight_layout()
     _save(fig, output_dir, "14_per_endpoint_latency.png")
 
 
@@ -1590,40 +1878,26 @@ def plot_per_endpoint_latency(bursts, output_dir):
 # Graph 15 – k6 per-endpoint error rate per burst
 # ---------------------------------------------------------------------------
 
-def plot_k6_error_rate(bursts, output_dir):
+def plot_k6_error_rate(bursts_arr, output_dir):
     """Graph 15: per-endpoint HTTP error rate (fraction of failed requests) over bursts.
 
     Only meaningful for k6 bursts — fortio burst records carry error_rate=0.0.
     Skipped if no endpoint has any non-zero error rate.
     """
-    by_ep = defaultdict(dict)
-    for b in bursts:
-        er = b.get("error_rate", 0.0)
-        if er is not None:
-            by_ep[b["endpoint"]][b["index"]] = er
-
-    # Only include endpoints that actually have error data
-    endpoints = [e for e in ENDPOINT_ORDER if e in by_ep]
-    if not endpoints:
-        endpoints = sorted(by_ep.keys())
+    # Only include rows (and so endpoints) that actually have error data
+    with_er = bursts_arr[~np.isnan(bursts_arr["error_rate"])]
+    endpoints = _endpoints_present(with_er)
 
     # Skip graph entirely if all error rates are zero across all endpoints
-    all_zero = all(
-        v == 0.0
-        for ep in endpoints
-        for v in by_ep[ep].values()
-    )
-    if all_zero:
+    if not np.any(with_er["error_rate"] != 0.0):
         print("⚠ All error rates are 0 — skipping graph 15")
         return
 
-    all_idx = sorted({b["index"] for b in bursts})
-    fig, ax = plt.subplots(figsize=(14, 5))
+    fig, ax = plt.subplots(figsize=(14, 5), layout="constrained")
 
     for ep in endpoints:
-        idx_map = by_ep[ep]
-        idx_list = sorted(idx_map.keys())
-        rates = [idx_map[i] * 100 for i in idx_list]  # fraction → %
+        ep_arr = with_er[with_er["endpoint"] == ep]
+        idx_list, rates = _last_per_index(ep_arr["index"], ep_arr["error_rate"] * 100)  # fraction → %
         color = ENDPOINT_COLORS.get(ep, "#666")
         ax.plot(idx_list, rates, "o-", color=color, linewidth=2, markersize=5, label=f"/{ep}")
 
@@ -1638,7 +1912,6 @@ def plot_k6_error_rate(bursts, output_dir):
     ax.set_ylim(bottom=0)
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
     _save(fig, output_dir, "15_k6_error_rate.png")
 
 
@@ -1646,61 +1919,133 @@ def plot_k6_error_rate(bursts, output_dir):
 # Summary stats
 # ---------------------------------------------------------------------------
 
-def generate_summary_stats(bursts, snapshots, output_dir):
+def generate_summary_stats(bursts_arr, snapshots, output_dir):
     output_path = os.path.join(output_dir, "summary_stats.txt")
-    with open(output_path, 'w') as f:
-        f.write("Baseline Test Summary Statistics\n")
-        f.write("=" * 60 + "\n\n")
-        f.write("LATENCY METRICS:\n")
-        f.write("-" * 40 + "\n")
-        p50_vals  = [b["p50"]  * 1000 for b in bursts]
-        p95_vals  = [b["p95"]  * 1000 for b in bursts]
-        p99_vals  = [b["p99"]  * 1000 for b in bursts]
-        p999_vals = [b["p999"] * 1000 for b in bursts]
-        for label, vals in [("p50", p50_vals), ("p95", p95_vals),
-                             ("p99", p99_vals), ("p999", p999_vals)]:
-            f.write(f"{label}:  mean={np.mean(vals):.2f}ms, "
-                    f"median={np.median(vals):.2f}ms, "
-                    f"min={np.min(vals):.2f}ms, max={np.max(vals):.2f}ms\n")
-        f.write("\n")
-        f.write("LATENCY BY ENDPOINT:\n")
-        f.write("-" * 40 + "\n")
-        by_ep = defaultdict(list)
-        for b in bursts:
-            by_ep[b["endpoint"]].append(b)
-        for ep in sorted(by_ep.keys()):
-            ep_p95 = [b["p95"] * 1000 for b in by_ep[ep]]
-            f.write(f"  {ep}: p95 median={np.median(ep_p95):.1f}ms "
-                    f"mean={np.mean(ep_p95):.1f}ms "
-                    f"max={np.max(ep_p95):.1f}ms\n")
-        f.write("\n")
-        f.write("QPS METRICS:\n")
-        f.write("-" * 40 + "\n")
-        qps_vals = [b["actual_qps"] for b in bursts]
-        f.write(f"Actual QPS: mean={np.mean(qps_vals):.2f}, "
-                f"median={np.median(qps_vals):.2f}, "
-                f"min={np.min(qps_vals):.2f}, max={np.max(qps_vals):.2f}\n")
-        f.write(f"Total bursts: {len(bursts)}\n")
-        f.write(f"Total requests: {sum(b['count'] for b in bursts)}\n\n")
-        if snapshots:
-            f.write("POD PLACEMENT METRICS:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total snapshots: {len(snapshots)}\n")
-            all_nodes = set()
-            for snap in snapshots:
-                all_nodes.update(snap["node_counts"].keys())
-            f.write(f"Nodes: {', '.join(sorted(all_nodes))}\n")
-            for node in sorted(all_nodes):
-                counts = [snap["node_counts"].get(node, 0) for snap in snapshots]
-                f.write(f"  {node}: mean={np.mean(counts):.1f} pods, "
-                        f"min={np.min(counts)}, max={np.max(counts)}\n")
+    # Collect the report in memory and write it out once
+    parts = []
+    w = parts.append
+    w("Baseline Test Summary Statistics\n")
+    w("=" * 60 + "\n\n")
+    w("LATENCY METRICS:\n")
+    w("-" * 40 + "\n")
+    labels = ("p50", "p95", "p99", "p999")
+    lat = np.column_stack([bursts_arr[k] for k in labels]) * 1000   # (n_bursts, 4)
+    stats = zip(labels, lat.mean(axis=0), np.median(lat, axis=0),
+                lat.min(axis=0), lat.max(axis=0))
+    for label, mean, med, lo, hi in stats:
+        w(f"{label}:  mean={mean:.2f}ms, "
+          f"median={med:.2f}ms, "
+          f"min={lo:.2f}ms, max={hi:.2f}ms\n")
+    w("\n")
+    w("LATENCY BY ENDPOINT:\n")
+    w("-" * 40 + "\n")
+    for ep in sorted(set(bursts_arr["endpoint"].tolist())):
+        ep_p95 = bursts_arr["p95"][bursts_arr["endpoint"] == ep] * 1000
+        w(f"  {ep}: p95 median={np.median(ep_p95):.1f}ms "
+          f"mean={np.mean(ep_p95):.1f}ms "
+          f"max={np.max(ep_p95):.1f}ms\n")
+    w("\n")
+    w("QPS METRICS:\n")
+    w("-" * 40 + "\n")
+    qps_vals = bursts_arr["actual_qps"]
+    w(f"Actual QPS: mean={np.mean(qps_vals):.2f}, "
+      f"median={np.median(qps_vals):.2f}, "
+      f"min={np.min(qps_vals):.2f}, max={np.max(qps_vals):.2f}\n")
+    w(f"Total bursts: {len(bursts_arr)}\n")
+    w(f"Total requests: {bursts_arr['count'].sum()}\n\n")
+    if snapshots:
+        w("POD PLACEMENT METRICS:\n")
+        w("-" * 40 + "\n")
+        w(f"Total snapshots: {len(snapshots)}\n")
+        nodes, counts = _node_count_matrix(snapshots)
+        w(f"Nodes: {', '.join(nodes)}\n")
+        for node, mean, lo, hi in zip(nodes, counts.mean(axis=0),
+                                      counts.min(axis=0), counts.max(axis=0)):
+            w(f"  {node}: mean={mean:.1f} pods, "
+              f"min={lo}, max={hi}\n")
+    Path(output_path).write_text("".join(parts), encoding="utf-8")
     print(f"✓ Generated: {output_path}")
 
 
+# ---------------------------------------------------------------------------
+# Parallel rendering
+# ---------------------------------------------------------------------------
+
+def _init_render_worker(rc):
+    """Pool initializer: import matplotlib and carry CLI-driven rcParams (e.g. --dpi)
+    into spawned workers."""
+    _import_plotting()
+    plt.rcParams.update(rc)
+
+
+def _render_task(task):
+    """Run one queued (name, func, args, kwargs) plot call; return its captured stdout."""
+    name, func, a, kw = task
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            func(*a, **kw)
+        except Exception as e:
+            print(f"  ⚠ {name}: {e}")
+        finally:
+            plt.close("all")
+    return buf.getvalue()
+
+
+def _render_all(tasks, jobs):
+    """Render queued plot tasks on up to `jobs` processes, printing output in queue order.
+
+    Tasks whose func is None are section headers and are printed as-is. Workers
+    use the spawn start method so each gets a fresh Agg state; only plain data
+    (records, arrays, paths) crosses the process boundary.
+    """
+    plots = [t for t in tasks if t[1] is not None]
+
+    def _emit(outputs):
+        for t in tasks:
+            print(t[0] if t[1] is None else next(outputs), end="")
+
+    if jobs > 1 and len(plots) > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(min(jobs, len(plots)), initializer=_init_render_worker,
+                      initargs=({"savefig.dpi": plt.rcParams["savefig.dpi"]},)) as pool:
+            _emit(pool.imap(_render_task, plots))
+    else:
+        _emit(map(_render_task, plots))
+
+
 # ---------------------------------------------------------------------------
 # main
 # ---------------------------------------------------------------------------
 
+README_TEMPLATE = """\
+Experiment graphs — view in story order:
+
+  01_qps_comparison.png             – Actual QPS per burst
+  02_latency_percentiles.png         – p50/p95/p99 per endpoint over time (warm-up phase annotated)
+  03_latency_vs_qps.png              – Latency vs QPS scatter (p50/p95/p99)
+  04_pod_distribution.png            – Pod count per node over time + imbalance ratio
+  05_service_placement_by_node.png   – Service placement heatmap (avg pods per node)
+  06_latency_distribution.png        – Latency boxplots split by endpoint (cart/home/product)
+  13_hpa_latency_timeline.png        – HPA replica count (bottom) + per-endpoint p95 (top) over time
+  14_per_endpoint_latency.png        – Grouped boxplot comparing /cart /home /product latency
+
+  Network graphs (require s2s probe data):
+  07_cross_node_ratio.png            – % of calls that crossed a node per service pair
+  08_same_vs_cross_node_cdf.png      – Latency CDF: same-node vs cross-node calls
+  09_p95_vs_replicas.png             – p95 latency vs total running replicas
+  09b_p95_vs_node_count.png          – p95 latency vs pod spread across nodes
+  11_queueing_vs_rtt.png             – Decomposition: network RTT vs server queueing delay (log scale)
+  11b_network_rtt_only.png           – Connect-time time-series + CDF (bimodal split)
+  12_connect_time_cdf.png            – Connection-time distribution: fast (<5ms) vs slow (DNS)
+
+  (Graphs 10/10b skipped: only useful when probes come from multiple source nodes)
+
+  15_k6_error_rate.png               – Per-endpoint HTTP error rate per burst (k6 only)
+  summary_stats.txt                  – Numeric summary
+"""
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate visualization graphs from baseline test data"
@@ -1709,8 +2054,21 @@ def main():
                         help="Path to run data directory (defaults to latest under ./data)")
     parser.add_argument("-o", "--output",
                         help="Output directory for graphs (default: <data_dir>/graphs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse all input files instead of using <data_dir>/.cache")
+    parser.add_argument("--dpi", type=int, default=150,
+                        help="Resolution of the saved PNGs (default: 150)")
+    parser.add_argument("--publication", action="store_true",
+                        help="Save print-quality PNGs at 300 dpi (overrides --dpi)")
+    parser.add_argument("-j", "--jobs", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Render graphs in this many processes (default: up to 4; 1 = serial)")
     args = parser.parse_args()
 
+    global CACHE_ENABLED
+    CACHE_ENABLED = not args.no_cache
+    _import_plotting()
+    plt.rcParams["savefig.dpi"] = 300 if args.publication else args.dpi
+
     if args.data_dir:
         data_dir = args.data_dir
     else:
@@ -1736,11 +2094,11 @@ def main():
     print(f"Output directory:       {output_dir}\n")
 
     print("Loading data...")
-    bursts = load_burst_data(data_dir)
-    if not bursts:
+    bursts_arr = load_burst_data(data_dir)
+    if not len(bursts_arr):
         print("Error: No burst data found")
         sys.exit(1)
-    print(f"  Loaded {len(bursts)} burst files")
+    print(f"  Loaded {len(bursts_arr)} burst files")
 
     bursts_config = load_bursts_jsonl(data_dir)
     if bursts_config:
@@ -1750,17 +2108,16 @@ def main():
     print(f"  {'Loaded ' + str(len(snapshots)) + ' pod snapshots' if snapshots else 'No pod placement data'}")
 
     placement        = load_service_placement(data_dir)
-    s2s_records      = load_s2s_data(data_dir)
+    s2s              = load_s2s_data(data_dir)
     service_to_nodes = load_service_endpoint_nodes(data_dir)
-    latency_rows     = load_latency_vs_replicas(data_dir)
+    replica_cols     = load_latency_vs_replicas(data_dir)
 
     # Load service call graph for east-west traffic analysis (graphs 07 + 08)
     _sg_path = os.path.join(data_dir, "baseline", "service-graph.json")
     service_graph_edges = []
     if os.path.exists(_sg_path):
         try:
-            with open(_sg_path) as _f:
-                _sg = json.load(_f)
+            _sg = _read_json(_sg_path)
             service_graph_edges = [
                 (e["from"].split("/")[1], e["to"].split("/")[1])
                 for e in _sg.get("edges", [])
@@ -1771,43 +2128,51 @@ def main():
         except Exception as _e:
             print(f"  ⚠ Could not load service graph: {_e}")
     _network_dir = os.path.join(data_dir, "network-analysis")
+    # Graphs 07 and 08 share one pass over the placement snapshots
+    ew_fractions = None
+    if service_graph_edges:
+        ew_fractions, _ = _compute_east_west_fractions(_network_dir, service_graph_edges)
 
-    if s2s_records:
-        print(f"  Loaded {len(s2s_records)} s2s probe records")
+    if len(s2s):
+        print(f"  Loaded {len(s2s)} s2s probe records")
     else:
         print("  No s2s probe data (graphs 07–11 skipped or partially skipped)")
 
     LOADGEN = "fortio-loadgen"
-    s2s_boutique   = [r for r in s2s_records if (r.get("source_pod") or "").strip() != LOADGEN]
-    s2s_for_net    = s2s_boutique if s2s_boutique else s2s_records
-    from_lg_only   = bool(s2s_records) and not s2s_boutique
+    s2s_boutique   = s2s[[(p or "").strip() != LOADGEN for p in s2s["source_pod"].tolist()]]
+    s2s_for_net    = s2s_boutique if len(s2s_boutique) else s2s
+    from_lg_only   = bool(len(s2s)) and not len(s2s_boutique)
+
+    # Queue every graph, then render them (in parallel with --jobs > 1)
+    tasks = []
 
     def _plot(name, func, *a, **kw):
-        try:
-            func(*a, **kw)
-        except Exception as e:
-            print(f"  ⚠ {name}: {e}")
+        tasks.append((name, func, a, kw))
+
+    def _section(title):
+        tasks.append((f"\n{title}\n", None, (), {}))
 
-    print("\nGenerating graphs 01–06 (load / latency / scaling / placement)...")
-    _plot("01", plot_qps_comparison,       bursts, output_dir, bursts_config)
-    _plot("02", plot_latency_percentiles,  bursts, output_dir)
-    _plot("03", plot_latency_vs_qps,       bursts, output_dir)
+    _section("Generating graphs 01–06 (load / latency / scaling / placement)...")
+    _plot("01", plot_qps_comparison,       bursts_arr, output_dir, bursts_config)
+    _plot("02", plot_latency_percentiles,  bursts_arr, output_dir)
+    _plot("03", plot_latency_vs_qps,       bursts_arr, output_dir)
     if snapshots:
         _plot("04", plot_pod_distribution, snapshots, output_dir)
     if placement:
         _plot("05", plot_service_placement, placement, output_dir)
-    _plot("06", plot_latency_distribution, bursts, output_dir)
-    generate_summary_stats(bursts, snapshots, output_dir)
+    _plot("06", plot_latency_distribution, bursts_arr, output_dir)
 
-    print("\nGenerating graphs 07–11 (network analysis)...")
+    _section("Generating graphs 07–11 (network analysis)...")
     _plot("07", plot_cross_node_ratio,          s2s_for_net, service_to_nodes, output_dir,
           from_loadgen_only=from_lg_only,
-          network_dir=_network_dir, service_graph_edges=service_graph_edges)
+          network_dir=_network_dir, service_graph_edges=service_graph_edges,
+          fractions=ew_fractions)
     _plot("08", plot_same_vs_cross_node_cdf,    s2s_for_net, service_to_nodes, output_dir,
           from_loadgen_only=from_lg_only,
-          network_dir=_network_dir, service_graph_edges=service_graph_edges)
-    _plot("09", plot_p95_vs_replicas,           latency_rows, output_dir)
-    _plot("09b", plot_p95_vs_node_count,        latency_rows, output_dir)
+          network_dir=_network_dir, service_graph_edges=service_graph_edges,
+          fractions=ew_fractions)
+    _plot("09", plot_p95_vs_replicas,           replica_cols, output_dir)
+    _plot("09b", plot_p95_vs_node_count,        replica_cols, output_dir)
     # Graphs 10 and 10b only provide value when probes come from multiple source nodes;
     # they are skipped by default. Uncomment below to re-enable.
     # _plot("10", plot_node_pair_heatmap,         s2s_for_net, output_dir, from_loadgen_only=from_lg_only)
@@ -1815,35 +2180,19 @@ def main():
     _plot("11", plot_queueing_vs_rtt,           s2s_for_net, output_dir, from_loadgen_only=from_lg_only)
     _plot("11b", plot_network_rtt_only,         s2s_for_net, output_dir, from_loadgen_only=from_lg_only)
 
-    print("\nGenerating new graphs 12–15...")
-    _plot("12", plot_connect_time_cdf,     bursts, output_dir)
-    _plot("13", plot_hpa_latency_timeline, bursts, latency_rows, output_dir)
-    _plot("14", plot_per_endpoint_latency, bursts, output_dir)
-    _plot("15", plot_k6_error_rate,        bursts, output_dir)
+    _section("Generating new graphs 12–15...")
+    _plot("12", plot_connect_time_cdf,     bursts_arr, output_dir)
+    _plot("13", plot_hpa_latency_timeline, bursts_arr, replica_cols, output_dir)
+    _plot("14", plot_per_endpoint_latency, bursts_arr, output_dir)
+    _plot("15", plot_k6_error_rate,        bursts_arr, output_dir)
+
+    _render_all(tasks, args.jobs)
+    # Outside the render queue so its errors are not swallowed by _render_task
+    generate_summary_stats(bursts_arr, snapshots, output_dir)
 
     # Update README
     readme = os.path.join(output_dir, "README.txt")
-    with open(readme, "w") as f:
-        f.write("Experiment graphs — view in story order:\n\n")
-        f.write("  01_qps_comparison.png             – Actual QPS per burst\n")
-        f.write("  02_latency_percentiles.png         – p50/p95/p99 per endpoint over time (warm-up phase annotated)\n")
-        f.write("  03_latency_vs_qps.png              – Latency vs QPS scatter (p50/p95/p99)\n")
-        f.write("  04_pod_distribution.png            – Pod count per node over time + imbalance ratio\n")
-        f.write("  05_service_placement_by_node.png   – Service placement heatmap (avg pods per node)\n")
-        f.write("  06_latency_distribution.png        – Latency boxplots split by endpoint (cart/home/product)\n")
-        f.write("  13_hpa_latency_timeline.png        – HPA replica count (bottom) + per-endpoint p95 (top) over time\n")
-        f.write("  14_per_endpoint_latency.png        – Grouped boxplot comparing /cart /home /product latency\n\n")
-        f.write("  Network graphs (require s2s probe data):\n")
-        f.write("  07_cross_node_ratio.png            – % of calls that crossed a node per service pair\n")
-        f.write("  08_same_vs_cross_node_cdf.png      – Latency CDF: same-node vs cross-node calls\n")
-        f.write("  09_p95_vs_replicas.png             – p95 latency vs total running replicas\n")
-        f.write("  09b_p95_vs_node_count.png          – p95 latency vs pod spread across nodes\n")
-        f.write("  11_queueing_vs_rtt.png             – Decomposition: network RTT vs server queueing delay (log scale)\n")
-        f.write("  11b_network_rtt_only.png           – Connect-time time-series + CDF (bimodal split)\n")
-        f.write("  12_connect_time_cdf.png            – Connection-time distribution: fast (<5ms) vs slow (DNS)\n\n")
-        f.write("  (Graphs 10/10b skipped: only useful when probes come from multiple source nodes)\n\n")
-        f.write("  15_k6_error_rate.png               – Per-endpoint HTTP error rate per burst (k6 only)\n")
-        f.write("  summary_stats.txt                  – Numeric summary\n")
+    Path(readme).write_text(README_TEMPLATE, encoding="utf-8")
     print(f"✓ Generated: {readme}")
     print(f"\n✓ All graphs written to: {output_dir}")
 
@@ -10,27 +10,50 @@ Generates:
 """
 
 import argparse
+import csv
+import functools
+import heapq
+import io
 import json
 import math
+import os
 import statistics
 import sys
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+# orjson decodes straight from bytes and is several times faster than the stdlib
+# parser on large kubectl snapshots and probe logs; stdlib json is the fallback.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _pct_sorted(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of a sorted, non-empty sequence (no branches)."""
+    n = len(values)
+    pos = (n - 1) * (q / 100.0)
+    low = int(pos)
+    high = low + 1 if low + 1 < n else low
+    weight = pos - low
+    return values[low] * (1 - weight) + values[high] * weight
 
 
 def percentile(values: List[float], q: float) -> Optional[float]:
     if not values:
         return None
-    if len(values) == 1:
-        return values[0]
-    pos = (len(values) - 1) * (q / 100.0)
-    low = int(math.floor(pos))
-    high = int(math.ceil(pos))
-    if low == high:
-        return values[low]
-    weight = pos - low
-    return values[low] * (1 - weight) + values[high] * weight
+    return _pct_sorted(values, q)
+
+
+def percentile_many(values: Sequence[float], qs: Sequence[float]) -> List[float]:
+    """percentile() at several q from one sort (values must be non-empty)."""
+    ordered = sorted(values)
+    return [_pct_sorted(ordered, q) for q in qs]
 
 
 def safe_mean(values: List[float]) -> Optional[float]:
@@ -47,11 +70,35 @@ def format_ms(v: Optional[float]) -> str:
 
 def load_json(path: Path) -> Optional[dict]:
     try:
-        return json.loads(path.read_text())
+        return _json_loads(path.read_bytes())
     except Exception:
         return None
 
 
+# Parsed snapshots _load_many keeps in flight ahead of its consumer
+LOAD_AHEAD = 16
+
+
+def _load_many(paths: Sequence[Path]) -> Iterator[Optional[dict]]:
+    """Yield load_json over many independent snapshot files, in path order.
+
+    File reads release the GIL, so a small thread pool overlaps them with parsing.
+    At most LOAD_AHEAD results are held at once, so memory stays flat however
+    many (large) fortio / endpoint files there are.
+    """
+    if len(paths) < 2:
+        yield from map(load_json, paths)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        pending: deque = deque()
+        for p in paths:
+            pending.append(ex.submit(load_json, p))
+            if len(pending) >= LOAD_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def detect_timestamp_from_name(path: Path, prefix: str) -> str:
     stem = path.stem
     if stem.startswith(prefix):
@@ -59,10 +106,35 @@ def detect_timestamp_from_name(path: Path, prefix: str) -> str:
     return "unknown"
 
 
+SNAPSHOT_PREFIXES = ("pod-network-", "service-endpoints-", "hpa-")
+
+
+@functools.lru_cache(maxsize=16)
+def list_snapshots(network_dir: Path) -> Mapping[str, Tuple[Path, ...]]:
+    """Snapshot <prefix>*.json files in network_dir, bucketed by SNAPSHOT_PREFIXES.
+
+    One os.scandir pass replaces a glob per loader; each bucket is in name order.
+    """
+    buckets: Dict[str, List[str]] = {prefix: [] for prefix in SNAPSHOT_PREFIXES}
+    try:
+        with os.scandir(network_dir) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        for prefix in SNAPSHOT_PREFIXES:
+            if name.startswith(prefix):
+                buckets[prefix].append(name)
+                break
+    return MappingProxyType({
+        prefix: tuple(network_dir / name for name in bucket) for prefix, bucket in buckets.items()
+    })
+
+
 def load_pod_snapshots(network_dir: Path) -> List[dict]:
     snapshots = []
-    for p in sorted(network_dir.glob("pod-network-*.json")):
-        payload = load_json(p)
+    paths = list_snapshots(network_dir)["pod-network-"]
+    for p, payload in zip(paths, _load_many(paths)):
         if not payload:
             continue
         timestamp = detect_timestamp_from_name(p, "pod-network-")
@@ -75,7 +147,7 @@ def load_pod_snapshots(network_dir: Path) -> List[dict]:
     return snapshots
 
 
-def load_service_endpoint_nodes(network_dir: Path) -> Dict[str, Set[str]]:
+def load_service_endpoint_nodes(network_dir: Path) -> Dict[str, FrozenSet[str]]:
     """Build service → set-of-nodes map.
 
     Preferred source: service-endpoints-*.json (kubectl get endpoints -o json).
@@ -85,8 +157,8 @@ def load_service_endpoint_nodes(network_dir: Path) -> Dict[str, Set[str]]:
     service_to_nodes: Dict[str, Set[str]] = defaultdict(set)
 
     # --- primary: service-endpoints snapshots ---
-    for p in sorted(network_dir.glob("service-endpoints-*.json")):
-        payload = load_json(p)
+    endpoint_paths = list_snapshots(network_dir)["service-endpoints-"]
+    for payload in _load_many(endpoint_paths):
         if not payload:
             continue
         for item in payload.get("items", []):
@@ -98,15 +170,14 @@ def load_service_endpoint_nodes(network_dir: Path) -> Dict[str, Set[str]]:
                         service_to_nodes[service_name].add(node_name)
 
     # --- fallback: pod-network snapshots (pod list with nodeName + app label) ---
-    pod_sources = list(sorted(network_dir.glob("pod-network-*.json")))
+    pod_sources = list(list_snapshots(network_dir)["pod-network-"])
     # Also try baseline/pods.json one directory up
     baseline_pods = network_dir.parent / "baseline" / "pods.json"
     if baseline_pods.exists():
         pod_sources.insert(0, baseline_pods)
 
     if not service_to_nodes and pod_sources:
-        for p in pod_sources:
-            payload = load_json(p)
+        for payload in _load_many(pod_sources):
             if not payload:
                 continue
             for item in payload.get("items", []):
@@ -120,85 +191,90 @@ def load_service_endpoint_nodes(network_dir: Path) -> Dict[str, Set[str]]:
                 if app and node and phase == "Running":
                     service_to_nodes[app].add(node)
 
-    return service_to_nodes
+    return {k: frozenset(v) for k, v in service_to_nodes.items()}
 
 
-def summarize_pod_placement(pod_snapshots: List[dict]) -> dict:
-    pod_history = defaultdict(list)
+def _extract(pod: dict) -> Tuple[str, str, str]:
+    """(pod name, app label, node name) of a pod item, "unknown" where missing."""
+    md = pod.get("metadata") or {}
+    spec = pod.get("spec") or {}
+    return (
+        md.get("name", "unknown"),
+        (md.get("labels") or {}).get("app", "unknown"),
+        spec.get("nodeName", "unknown"),
+    )
+
+
+def summarize_pod_placement(pod_snapshots: List[dict]) -> Tuple[dict, Dict[str, int]]:
+    """Return (placement summary, timestamp -> number of distinct nodes with at least one pod)."""
+    # pod name -> [(timestamp, node, app)]; dicts are only built for pods that moved
+    pod_history: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
     ts_node_to_pods = {}
+    ts_pods: Dict[str, List[Tuple[str, str, str]]] = {}
+    ts_to_node_count: Dict[str, int] = {}
+    first_node_seen: Dict[str, str] = {}
+    moved: Set[str] = set()
 
-    for snap in pod_snapshots:
+    # Walk the raw pod dicts once; every aggregation below reads these tuples
+    extracted = [[_extract(pod) for pod in snap["items"]] for snap in pod_snapshots]
+
+    for snap, pods in zip(pod_snapshots, extracted):
         ts = snap["timestamp"]
         node_to_pods = defaultdict(list)
-        for pod in snap["items"]:
-            md = pod.get("metadata", {})
-            spec = pod.get("spec", {})
-            labels = md.get("labels", {})
-
-            pod_name = md.get("name", "unknown")
-            app = labels.get("app", "unknown")
-            node = spec.get("nodeName", "unknown")
-
-            pod_history[pod_name].append({"timestamp": ts, "node": node, "app": app})
+        for pod_name, app, node in pods:
+            pod_history[pod_name].append((ts, node, app))
+            if first_node_seen.setdefault(pod_name, node) != node:
+                moved.add(pod_name)
             node_to_pods[node].append(pod_name)
         ts_node_to_pods[ts] = node_to_pods
+        ts_pods[ts] = pods
+        ts_to_node_count[ts] = sum(1 for node in node_to_pods if node and node != "unknown")
 
-    pod_movements = {}
-    for pod_name, entries in pod_history.items():
-        nodes = [e["node"] for e in entries]
-        unique = sorted(set(nodes))
-        if len(unique) > 1:
-            pod_movements[pod_name] = entries
+    pod_movements = {
+        name: [{"timestamp": ts, "node": node, "app": app} for ts, node, app in entries]
+        for name, entries in pod_history.items() if name in moved
+    }
 
-    latest_ts = sorted(ts_node_to_pods.keys())[-1] if ts_node_to_pods else None
+    latest_ts = max(ts_node_to_pods) if ts_node_to_pods else None
     latest = ts_node_to_pods.get(latest_ts, {})
 
     # Service -> node -> pod count from **latest snapshot only** (actual current placement)
-    latest_snap = next((s for s in pod_snapshots if s["timestamp"] == latest_ts), None)
+    # Count (service, node) pairs in one Counter, then pivot per service
+    svc_node_counts = Counter(
+        (app, node) for _, app, node in ts_pods.get(latest_ts, ())
+        if node and node != "unknown"
+    )
+    latest_svc_nodes: Dict[str, Dict[str, int]] = {}
+    for (svc, node), n in svc_node_counts.items():
+        latest_svc_nodes.setdefault(svc, {})[node] = n
     service_node_spread = {}
-    if latest_snap:
-        service_node_counter_latest: Dict[str, Counter] = defaultdict(Counter)
-        for pod in latest_snap["items"]:
-            app = (pod.get("metadata") or {}).get("labels", {}).get("app", "unknown")
-            node = (pod.get("spec") or {}).get("nodeName", "unknown")
-            if node and node != "unknown":
-                service_node_counter_latest[app][node] += 1
-        for svc, counter in service_node_counter_latest.items():
-            service_node_spread[svc] = {
-                "nodes_used": sorted(counter.keys()),
-                "node_count": len(counter),
-                "pod_count_by_node": dict(counter),
-            }
+    for svc, by_node in latest_svc_nodes.items():
+        service_node_spread[svc] = {
+            "nodes_used": sorted(by_node),
+            "node_count": len(by_node),
+            "pod_count_by_node": by_node,
+        }
 
     # Service -> node -> average pod count over all snapshots (for heatmap "average snapshot")
     service_node_spread_avg: Dict[str, dict] = {}
     if pod_snapshots:
-        all_services_avg: Set[str] = set()
-        all_nodes_avg: Set[str] = set()
-        per_snap: List[Dict[str, Dict[str, int]]] = []
-        for snap in pod_snapshots:
-            counter: Dict[str, Counter] = defaultdict(Counter)
-            for pod in snap["items"]:
-                app = (pod.get("metadata") or {}).get("labels", {}).get("app", "unknown")
-                node = (pod.get("spec") or {}).get("nodeName", "unknown")
-                if node and node != "unknown":
-                    counter[app][node] += 1
-                    all_services_avg.add(app)
-                    all_nodes_avg.add(node)
-            per_snap.append({svc: dict(ct) for svc, ct in counter.items()})
-        n_snapshots = len(pod_snapshots)
-        for svc in sorted(all_services_avg):
-            pod_count_by_node_avg = {}
-            for node in sorted(all_nodes_avg):
-                total = sum(snap.get(svc, {}).get(node, 0) for snap in per_snap)
-                pod_count_by_node_avg[node] = round(total / n_snapshots, 2)
+        # Sum pod counts over all snapshots in one (service, node) Counter and divide
+        # once at the end
+        totals = Counter(
+            (app, node) for pods in extracted for _, app, node in pods
+            if node and node != "unknown"
+        )
+        n_snaps = len(pod_snapshots)
+        # Dict order is irrelevant here (write_json sorts keys); only nodes_used must be sorted
+        nodes_sorted = sorted({node for _, node in totals})
+        for svc in dict.fromkeys(svc for svc, _ in totals):
             service_node_spread_avg[svc] = {
-                "nodes_used": sorted(all_nodes_avg),
-                "node_count": len(all_nodes_avg),
-                "pod_count_by_node": pod_count_by_node_avg,
+                "nodes_used": list(nodes_sorted),
+                "node_count": len(nodes_sorted),
+                "pod_count_by_node": {node: round(totals[(svc, node)] / n_snaps, 2) for node in nodes_sorted},
             }
 
-    return {
+    placement = {
         "latest_timestamp": latest_ts,
         "latest_node_to_pods": {k: sorted(v) for k, v in latest.items()},
         "pod_movements": pod_movements,
@@ -206,6 +282,7 @@ def summarize_pod_placement(pod_snapshots: List[dict]) -> dict:
         "service_node_spread_avg": service_node_spread_avg,
         "snapshot_count": len(pod_snapshots),
     }
+    return placement, ts_to_node_count
 
 
 def parse_fortio_percentiles(payload: dict) -> Dict[float, float]:
@@ -220,9 +297,14 @@ def parse_fortio_percentiles(payload: dict) -> Dict[float, float]:
     return out
 
 
+@functools.lru_cache(maxsize=4096)
+def _filename_tokens(name: str) -> Tuple[str, ...]:
+    return tuple(name.replace(".json", "").split("-"))
+
+
 def parse_endpoint_from_filename(name: str) -> str:
     # fortio-burst-<idx>-<endpoint>.json
-    parts = name.replace(".json", "").split("-")
+    parts = _filename_tokens(name)
     if len(parts) >= 4:
         return parts[-1]
     return "unknown"
@@ -232,8 +314,8 @@ def load_e2e_latency(load_dir: Path) -> dict:
     per_endpoint_records = defaultdict(list)
     per_burst_total_qps = {}
 
-    for p in sorted(load_dir.glob("fortio-burst-*-*.json")):
-        payload = load_json(p)
+    paths = sorted(load_dir.glob("fortio-burst-*-*.json"))
+    for p, payload in zip(paths, _load_many(paths)):
         if not payload:
             continue
         endpoint = parse_endpoint_from_filename(p.name)
@@ -252,32 +334,35 @@ def load_e2e_latency(load_dir: Path) -> dict:
         per_endpoint_records[endpoint].append(rec)
 
         # burst id is token at index 2: fortio-burst-<idx>-...
-        tokens = p.name.replace(".json", "").split("-")
+        tokens = _filename_tokens(p.name)
         if len(tokens) >= 4 and tokens[2].isdigit():
             idx = int(tokens[2])
             per_burst_total_qps[idx] = per_burst_total_qps.get(idx, 0.0) + rec["actual_qps"]
 
     endpoint_summary = {}
     for endpoint, rows in per_endpoint_records.items():
-        p95s = sorted([r["p95_ms"] for r in rows if r["p95_ms"] is not None])
-        p99s = sorted([r["p99_ms"] for r in rows if r["p99_ms"] is not None])
+        p95s = [r["p95_ms"] for r in rows if r["p95_ms"] is not None]
+        p99s = [r["p99_ms"] for r in rows if r["p99_ms"] is not None]
         qs = [r["actual_qps"] for r in rows]
+        # q=100 is the max, so median and max come from the same sort
+        p95_med, p95_max = percentile_many(p95s, (50, 100)) if p95s else (None, None)
+        p99_med, p99_max = percentile_many(p99s, (50, 100)) if p99s else (None, None)
         endpoint_summary[endpoint] = {
             "runs": len(rows),
             "avg_actual_qps": safe_mean(qs),
             "max_actual_qps": max(qs) if qs else None,
-            "p95_ms_median": percentile(p95s, 50) if p95s else None,
-            "p95_ms_max": max(p95s) if p95s else None,
-            "p99_ms_median": percentile(p99s, 50) if p99s else None,
-            "p99_ms_max": max(p99s) if p99s else None,
+            "p95_ms_median": p95_med,
+            "p95_ms_max": p95_max,
+            "p99_ms_median": p99_med,
+            "p99_ms_max": p99_max,
         }
 
     burst_qps = sorted(per_burst_total_qps.values())
     cluster_summary = {
         "burst_count": len(per_burst_total_qps),
         "combined_actual_qps_avg": safe_mean(burst_qps),
-        "combined_actual_qps_p95": percentile(sorted(burst_qps), 95) if burst_qps else None,
-        "combined_actual_qps_max": max(burst_qps) if burst_qps else None,
+        "combined_actual_qps_p95": _pct_sorted(burst_qps, 95) if burst_qps else None,
+        "combined_actual_qps_max": burst_qps[-1] if burst_qps else None,
     }
 
     return {
@@ -286,79 +371,102 @@ def load_e2e_latency(load_dir: Path) -> dict:
     }
 
 
-def parse_probe_kv(raw: str) -> dict:
+# gRPC string codes: 'SERVING'→0, 'NOT_SERVING'→2, etc.
+GRPC_STATUS_CODES = {"SERVING": 0, "OK": 0, "NOT_SERVING": 2,
+                     "UNKNOWN": 2, "SERVICE_UNKNOWN": 5, "UNAVAILABLE": 14}
+
+
+def parse_probe_kv(raw: str) -> Dict[str, float]:
     out = {}
     for token in raw.split():
-        if "=" not in token:
+        k, sep, v = token.partition("=")
+        if not sep:
             continue
-        k, v = token.split("=", 1)
         if k in ("code", "grpc"):
             try:
                 out[k] = int(v)
-            except (ValueError, TypeError):
-                # gRPC string codes: 'SERVING'→0, 'NOT_SERVING'→2, etc.
-                _map = {"SERVING": 0, "OK": 0, "NOT_SERVING": 2,
-                        "UNKNOWN": 2, "SERVICE_UNKNOWN": 5, "UNAVAILABLE": 14}
-                out[k] = _map.get(str(v).upper(), 2)
+            except ValueError:
+                out[k] = GRPC_STATUS_CODES.get(v.upper(), 2)
         else:
             try:
                 # Probe string is written in ms (03e: curl s→ms; fortio: already ms)
                 out[k] = float(v)
-            except Exception:
+            except ValueError:
                 continue
     return out
 
 
-def load_service_to_service(network_dir: Path, service_to_nodes: Dict[str, Set[str]]) -> dict:
+_NO_NODES: FrozenSet[str] = frozenset()
+
+# Read buffer for the probe log, which is consumed line by line
+READ_BUFFER_BYTES = 64 * 1024
+
+
+def load_s2s_combined(
+    network_dir: Path,
+    service_to_nodes: Dict[str, FrozenSet[str]],
+) -> Tuple[dict, Dict[str, List[float]]]:
+    """Single pass over service-to-service-latency.jsonl.
+
+    Returns (s2s summary, timestamp -> list of probe total ms); the latter feeds
+    build_latency_vs_replicas so the probe log is only read once.
+    """
     p = network_dir / "service-to-service-latency.jsonl"
+    by_ts: Dict[str, List[float]] = defaultdict(list)
     if not p.exists():
-        return {"path_summary": {}, "global_summary": {}, "node_pair_summary": {}}
+        return {"path_summary": {}, "global_summary": {}, "node_pair_summary": {}}, by_ts
 
-    path_stats = defaultdict(lambda: defaultdict(list))
+    path_stats: Dict[str, Dict[str, list]] = {}
     node_pair_totals: Dict[tuple, List[float]] = defaultdict(list)
     same_node_total = 0
     all_total = 0
 
-    for raw in p.read_text().splitlines():
-        raw = raw.strip()
-        if not raw:
-            continue
-        try:
-            row = json.loads(raw)
-        except Exception:
-            continue
-        source_pod = row.get("source_pod", "unknown")
-        target_service = row.get("target_service", "unknown")
-        source_node = row.get("source_node") or "unknown"
-        path = f"{source_pod}->{target_service}"
-        metrics = parse_probe_kv(row.get("probe", ""))
-
-        if metrics.get("code") is not None:
-            path_stats[path]["code"].append(float(metrics["code"]))
-        if metrics.get("grpc"):
-            path_stats[path]["grpc"].append(1)
-        for metric in ("dns", "connect", "ttfb", "total"):
-            if metric in metrics:
-                path_stats[path][metric].append(metrics[metric])
-
-        if "total" in metrics and source_node != "unknown":
-            node_pair_totals[(source_node, target_service)].append(metrics["total"])
-
-        target_nodes = service_to_nodes.get(target_service, set())
-        if source_node and target_nodes:
-            # Only count successful probes toward intra-node ratio
-            code = metrics.get("code")
-            is_grpc = bool(metrics.get("grpc"))
-            ok_code = 0 if is_grpc else 200
-            if code is None or int(code) == ok_code:
-                all_total += 1
-                if source_node in target_nodes:
-                    same_node_total += 1
+    with open(p, "rb", buffering=READ_BUFFER_BYTES) as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                row = _json_loads(raw)
+            except Exception:
+                continue
+            source_pod = row.get("source_pod", "unknown")
+            target_service = row.get("target_service", "unknown")
+            source_node = row.get("source_node") or "unknown"
+            path = f"{source_pod}->{target_service}"
+            metrics = parse_probe_kv(row.get("probe", ""))
+
+            stats = path_stats.setdefault(path, {})
+            if metrics.get("code") is not None:
+                stats.setdefault("code", []).append(float(metrics["code"]))
+            if metrics.get("grpc"):
+                stats.setdefault("grpc", []).append(1)
+            for metric in ("dns", "connect", "ttfb", "total"):
+                if metric in metrics:
+                    stats.setdefault(metric, []).append(metrics[metric])
+
+            if "total" in metrics:
+                if source_node != "unknown":
+                    node_pair_totals[(source_node, target_service)].append(metrics["total"])
+                ts = row.get("timestamp")
+                if ts:
+                    by_ts[ts].append(metrics["total"])
+
+            target_nodes = service_to_nodes.get(target_service, _NO_NODES)
+            if source_node and target_nodes:
+                # Only count successful probes toward intra-node ratio
+                code = metrics.get("code")
+                is_grpc = bool(metrics.get("grpc"))
+                ok_code = 0 if is_grpc else 200
+                if code is None or int(code) == ok_code:
+                    all_total += 1
+                    if source_node in target_nodes:
+                        same_node_total += 1
 
     summary = {}
     total_samples = 0
     for path, metrics in path_stats.items():
-        totals = sorted(metrics.get("total", []))
+        totals = metrics.get("total", [])
         if not totals:
             continue
         total_samples += len(totals)
@@ -375,19 +483,20 @@ def load_service_to_service(network_dir: Path, service_to_nodes: Dict[str, Set[s
         if code_list:
             if is_grpc_path:
                 # gRPC: success = code 0 (OK); any non-zero code is an error
-                n_err = len([c for c in code_list if int(c) != 0])
+                n_err = sum(1 for c in code_list if c != 0)
             else:
                 # HTTP: success = 2xx; curl timeout shows as code 0 (treated as error too)
-                n_err = len([c for c in code_list if int(c) not in (200, 201, 204)])
+                n_err = sum(1 for c in code_list if c not in (200, 201, 204))
             err_rate = n_err / len(code_list)
         else:
             err_rate = None
+        p95, p99 = percentile_many(totals, (95, 99))
         summary[path] = {
             "samples": len(totals),
             "is_grpc": is_grpc_path,
             "total_avg_ms": safe_mean(totals),
-            "total_p95_ms": percentile(totals, 95),
-            "total_p99_ms": percentile(totals, 99),
+            "total_p95_ms": p95,
+            "total_p99_ms": p99,
             "dns_avg_ms": safe_mean(metrics.get("dns", [])) if not is_grpc_path else None,
             "connect_avg_ms": safe_mean(connect_list) if not is_grpc_path else None,
             "ttfb_avg_ms": safe_mean(ttfb_list) if not is_grpc_path else None,
@@ -400,13 +509,14 @@ def load_service_to_service(network_dir: Path, service_to_nodes: Dict[str, Set[s
         if not totals:
             continue
         key = f"{src_node} -> {tgt_svc}"
+        p95, p99 = percentile_many(totals, (95, 99))
         node_pair_summary[key] = {
             "source_node": src_node,
             "target_service": tgt_svc,
             "samples": len(totals),
             "total_avg_ms": safe_mean(totals),
-            "total_p95_ms": percentile(sorted(totals), 95),
-            "total_p99_ms": percentile(sorted(totals), 99),
+            "total_p95_ms": p95,
+            "total_p99_ms": p99,
         }
 
     global_summary = {
@@ -418,18 +528,20 @@ def load_service_to_service(network_dir: Path, service_to_nodes: Dict[str, Set[s
         "path_summary": summary,
         "global_summary": global_summary,
         "node_pair_summary": node_pair_summary,
-    }
+    }, by_ts
 
 
 def write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    # Always stdlib json: orjson would write NaN as null, leave non-ASCII unescaped
+    # and order int keys as strings, so output would depend on what is installed
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
 def load_hpa_snapshots(network_dir: Path) -> List[Tuple[str, dict]]:
     """Load HPA snapshots; return list of (timestamp, {hpa_name: {desired, current}})."""
     out = []
-    for p in sorted(network_dir.glob("hpa-*.json")):
-        payload = load_json(p)
+    paths = list_snapshots(network_dir)["hpa-"]
+    for p, payload in zip(paths, _load_many(paths)):
         if not payload:
             continue
         ts = detect_timestamp_from_name(p, "hpa-")
@@ -450,92 +562,60 @@ def load_hpa_snapshots(network_dir: Path) -> List[Tuple[str, dict]]:
     return out
 
 
-def get_ts_to_node_count(pod_snapshots: List[dict]) -> Dict[str, int]:
-    """From pod snapshots, return timestamp -> number of distinct nodes with at least one pod."""
-    out: Dict[str, int] = {}
-    for snap in pod_snapshots:
-        ts = snap.get("timestamp", "")
-        nodes: Set[str] = set()
-        for pod in snap.get("items", []):
-            node = (pod.get("spec") or {}).get("nodeName")
-            if node and node != "unknown":
-                nodes.add(node)
-        out[ts] = len(nodes)
-    return out
-
-
 def build_latency_vs_replicas(
     network_dir: Path,
     hpa_snapshots: List[Tuple[str, dict]],
+    by_ts: Dict[str, List[float]],
     ts_to_node_count: Optional[Dict[str, int]] = None,
 ) -> Optional[Path]:
-    """Build latency-vs-replicas.csv from HPA snapshots and s2s probes grouped by timestamp."""
+    """Build latency-vs-replicas.csv from HPA snapshots and s2s probe totals grouped by timestamp."""
     p = network_dir / "service-to-service-latency.jsonl"
     if not p.exists() or not hpa_snapshots:
         return None
     ts_to_node_count = ts_to_node_count or {}
 
-    # Group s2s probes by timestamp -> list of total ms
-    by_ts: Dict[str, List[float]] = defaultdict(list)
-    for raw in p.read_text().splitlines():
-        raw = raw.strip()
-        if not raw:
-            continue
-        try:
-            row = json.loads(raw)
-        except Exception:
-            continue
-        ts = row.get("timestamp")
-        if not ts:
-            continue
-        metrics = parse_probe_kv(row.get("probe", ""))
-        if "total" in metrics:
-            by_ts[ts].append(metrics["total"])
-
     # All HPA names across snapshots
     all_hpa_names = set()
     for _, per_hpa in hpa_snapshots:
         all_hpa_names.update(per_hpa.keys())
     all_hpa_names = sorted(all_hpa_names)
 
-    # Build rows: timestamp, then per-HPA desired/current, then s2s_p95_ms, s2s_p99_ms
+    # Build rows in header order: timestamp, per-HPA desired, per-HPA current,
+    # then s2s_p95_ms, s2s_p99_ms, node_count
     csv_path = network_dir / "latency-vs-replicas.csv"
     rows = []
     for ts, per_hpa in hpa_snapshots:
-        totals_at_ts = sorted(by_ts.get(ts, []))
-        s2s_p95 = percentile(totals_at_ts, 95) if totals_at_ts else None
-        s2s_p99 = percentile(totals_at_ts, 99) if totals_at_ts else None
-        row = {"timestamp": ts}
-        for name in all_hpa_names:
-            info = per_hpa.get(name, {})
-            row[f"{name}_desired"] = info.get("desired", "")
-            row[f"{name}_current"] = info.get("current", "")
-        row["s2s_p95_ms"] = f"{s2s_p95:.2f}" if s2s_p95 is not None else ""
-        row["s2s_p99_ms"] = f"{s2s_p99:.2f}" if s2s_p99 is not None else ""
-        row["node_count"] = str(ts_to_node_count.get(ts, ""))
-        rows.append(row)
+        totals_at_ts = by_ts.get(ts)
+        s2s_p95, s2s_p99 = percentile_many(totals_at_ts, (95, 99)) if totals_at_ts else (None, None)
+        infos = [per_hpa.get(name, {}) for name in all_hpa_names]
+        # desired/current are None when the HPA status omits them; csv.writer writes
+        # None as an empty cell, same as a missing HPA
+        rows.append(
+            [ts]
+            + [info.get("desired", "") for info in infos]
+            + [info.get("current", "") for info in infos]
+            + [
+                f"{s2s_p95:.2f}" if s2s_p95 is not None else "",
+                f"{s2s_p99:.2f}" if s2s_p99 is not None else "",
+                ts_to_node_count.get(ts, ""),
+            ]
+        )
 
     # Also include timestamps that have s2s but no HPA (e.g. partial overlap)
     hpa_ts_set = {r[0] for r in hpa_snapshots}
+    no_hpa = [""] * (2 * len(all_hpa_names))
     for ts in by_ts:
         if ts in hpa_ts_set:
             continue
-        totals_at_ts = sorted(by_ts[ts])
-        row = {"timestamp": ts}
-        for n in all_hpa_names:
-            row[f"{n}_desired"] = ""
-            row[f"{n}_current"] = ""
-        row["s2s_p95_ms"] = f"{percentile(totals_at_ts, 95):.2f}" if totals_at_ts else ""
-        row["s2s_p99_ms"] = f"{percentile(totals_at_ts, 99):.2f}" if totals_at_ts else ""
-        row["node_count"] = str(ts_to_node_count.get(ts, ""))
-        rows.append(row)
-    rows.sort(key=lambda r: r["timestamp"])
+        s2s_p95, s2s_p99 = percentile_many(by_ts[ts], (95, 99))
+        rows.append([ts, *no_hpa, f"{s2s_p95:.2f}", f"{s2s_p99:.2f}", ts_to_node_count.get(ts, "")])
+    rows.sort(key=lambda r: r[0])
 
     header = ["timestamp"] + [f"{n}_desired" for n in all_hpa_names] + [f"{n}_current" for n in all_hpa_names] + ["s2s_p95_ms", "s2s_p99_ms", "node_count"]
-    with open(csv_path, "w") as f:
-        f.write(",".join(header) + "\n")
-        for row in rows:
-            f.write(",".join(str(row.get(h, "")) for h in header) + "\n")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
     return csv_path
 
 
@@ -546,24 +626,25 @@ def write_text_report(
     s2s: dict,
     spread_stats: Optional[dict] = None,
 ) -> None:
-    lines = []
-    lines.append("Network Analysis Summary")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append("1) Node -> Pods (latest snapshot)")
-    lines.append("-" * 80)
-    lines.append(f"Latest timestamp: {placement.get('latest_timestamp', 'n/a')}")
+    buf = io.StringIO()
+    w = buf.write
+    w("Network Analysis Summary\n")
+    w("=" * 80 + "\n")
+    w("\n")
+    w("1) Node -> Pods (latest snapshot)\n")
+    w("-" * 80 + "\n")
+    w(f"Latest timestamp: {placement.get('latest_timestamp', 'n/a')}\n")
     latest = placement.get("latest_node_to_pods", {})
     if not latest:
-        lines.append("No pod snapshots found.")
+        w("No pod snapshots found.\n")
     else:
         for node, pods in sorted(latest.items()):
-            lines.append(f"{node}: {len(pods)} pods")
+            w(f"{node}: {len(pods)} pods\n")
             for pod in pods:
-                lines.append(f"  - {pod}")
-    lines.append("")
-    lines.append("1b) Service -> Nodes (which service's pods are on which node)")
-    lines.append("-" * 80)
+                w(f"  - {pod}\n")
+    w("\n")
+    w("1b) Service -> Nodes (which service's pods are on which node)\n")
+    w("-" * 80 + "\n")
     spread = placement.get("service_node_spread", {})
     if spread:
         for svc in sorted(spread.keys()):
@@ -572,103 +653,105 @@ def write_text_report(
             # Prefer pod_count_by_node (latest snapshot); fall back to samples_per_node (legacy)
             counts = info.get("pod_count_by_node") or info.get("samples_per_node", {})
             parts = [f"{n} ({counts.get(n, 0)} pod(s))" for n in nodes_used]
-            lines.append(f"  {svc}: {', '.join(parts)}")
+            w(f"  {svc}: {', '.join(parts)}\n")
     else:
-        lines.append("  No service-node spread data.")
-    lines.append("")
-    lines.append(f"Pods that moved nodes: {len(placement.get('pod_movements', {}))}")
-    lines.append("")
-    lines.append("2) End-to-end Latency (frontend endpoints)")
-    lines.append("-" * 80)
+        w("  No service-node spread data.\n")
+    w("\n")
+    w(f"Pods that moved nodes: {len(placement.get('pod_movements', {}))}\n")
+    w("\n")
+    w("2) End-to-end Latency (frontend endpoints)\n")
+    w("-" * 80 + "\n")
     cluster = e2e.get("cluster_summary", {})
-    lines.append(f"Burst count: {cluster.get('burst_count', 0)}")
-    lines.append(f"Combined actual QPS avg: {cluster.get('combined_actual_qps_avg')}")
-    lines.append(f"Combined actual QPS p95: {cluster.get('combined_actual_qps_p95')}")
-    lines.append(f"Combined actual QPS max: {cluster.get('combined_actual_qps_max')}")
-    lines.append("")
+    w(f"Burst count: {cluster.get('burst_count', 0)}\n")
+    w(f"Combined actual QPS avg: {cluster.get('combined_actual_qps_avg')}\n")
+    w(f"Combined actual QPS p95: {cluster.get('combined_actual_qps_p95')}\n")
+    w(f"Combined actual QPS max: {cluster.get('combined_actual_qps_max')}\n")
+    w("\n")
     for endpoint, data in sorted(e2e.get("endpoint_summary", {}).items()):
-        lines.append(f"{endpoint}:")
-        lines.append(f"  runs={data.get('runs', 0)} avg_qps={data.get('avg_actual_qps')}")
-        lines.append(f"  p95 median={format_ms(data.get('p95_ms_median'))} max={format_ms(data.get('p95_ms_max'))}")
-        lines.append(f"  p99 median={format_ms(data.get('p99_ms_median'))} max={format_ms(data.get('p99_ms_max'))}")
-    lines.append("")
-    lines.append("3) Service-to-Service Latency")
-    lines.append("-" * 80)
+        w(f"{endpoint}:\n")
+        w(f"  runs={data.get('runs', 0)} avg_qps={data.get('avg_actual_qps')}\n")
+        w(f"  p95 median={format_ms(data.get('p95_ms_median'))} max={format_ms(data.get('p95_ms_max'))}\n")
+        w(f"  p99 median={format_ms(data.get('p99_ms_median'))} max={format_ms(data.get('p99_ms_max'))}\n")
+    w("\n")
+    w("3) Service-to-Service Latency\n")
+    w("-" * 80 + "\n")
     g = s2s.get("global_summary", {})
-    lines.append(f"Measured paths: {g.get('path_count', 0)}")
-    lines.append(f"Latency samples: {g.get('total_samples', 0)}")
-    lines.append(f"Intra-node ratio: {g.get('intra_node_ratio')}")
-    lines.append("")
-    top_paths = sorted(
-        s2s.get("path_summary", {}).items(),
+    w(f"Measured paths: {g.get('path_count', 0)}\n")
+    w(f"Latency samples: {g.get('total_samples', 0)}\n")
+    w(f"Intra-node ratio: {g.get('intra_node_ratio')}\n")
+    w("\n")
+    # One top-15 selection by p95 serves both this section (top 12) and section 4;
+    # nlargest keeps the same tie order as sorted(..., reverse=True)[:15]
+    path_summary = s2s.get("path_summary", {})
+    paths_by_p95 = heapq.nlargest(
+        15,
+        path_summary.items(),
         key=lambda item: (item[1].get("total_p95_ms") or -1),
-        reverse=True,
-    )[:12]
-    for path, metric in top_paths:
-        lines.append(f"{path}")
-        lines.append(
+    )
+    for path, metric in paths_by_p95[:12]:
+        w(f"{path}\n")
+        w(
             f"  avg={format_ms(metric.get('total_avg_ms'))} "
             f"p95={format_ms(metric.get('total_p95_ms'))} "
             f"p99={format_ms(metric.get('total_p99_ms'))} "
-            f"err={metric.get('error_rate')}"
+            f"err={metric.get('error_rate')}\n"
         )
 
-    lines.append("")
-    lines.append("4) Queueing vs network decomposition (connect vs ttfb-connect)")
-    lines.append("-" * 80)
-    lines.append("  connect ≈ network RTT; queueing_avg = ttfb - connect ≈ server/queue delay")
-    path_summary = s2s.get("path_summary", {})
+    w("\n")
+    w("4) Queueing vs network decomposition (connect vs ttfb-connect)\n")
+    w("-" * 80 + "\n")
+    w("  connect ≈ network RTT; queueing_avg = ttfb - connect ≈ server/queue delay\n")
     if path_summary:
         connect_vals = []
         queueing_vals = []
-        for path, metric in sorted(path_summary.items(), key=lambda x: (x[1].get("total_p95_ms") or 0), reverse=True)[:15]:
+        for path, metric in paths_by_p95:
             c = metric.get("connect_avg_ms")
             q = metric.get("queueing_avg_ms")
             if c is not None:
                 connect_vals.append(c)
             if q is not None:
                 queueing_vals.append(q)
-            lines.append(f"  {path}")
-            lines.append(f"    connect_avg={format_ms(c)}  queueing_avg(ttfb-connect)={format_ms(q)}  total_avg={format_ms(metric.get('total_avg_ms'))}")
+            w(f"  {path}\n")
+            w(f"    connect_avg={format_ms(c)}  queueing_avg(ttfb-connect)={format_ms(q)}  total_avg={format_ms(metric.get('total_avg_ms'))}\n")
         if connect_vals or queueing_vals:
-            lines.append("")
-            lines.append(f"  Global (across shown paths): connect_avg={format_ms(safe_mean(connect_vals))}  queueing_avg={format_ms(safe_mean(queueing_vals))}")
+            w("\n")
+            w(f"  Global (across shown paths): connect_avg={format_ms(safe_mean(connect_vals))}  queueing_avg={format_ms(safe_mean(queueing_vals))}\n")
     else:
-        lines.append("  No path-level probe data.")
-    lines.append("")
-    lines.append("5) Tail latency by (source_node, target_service)")
-    lines.append("-" * 80)
+        w("  No path-level probe data.\n")
+    w("\n")
+    w("5) Tail latency by (source_node, target_service)\n")
+    w("-" * 80 + "\n")
     node_pair = s2s.get("node_pair_summary", {})
     if node_pair:
-        top_pairs = sorted(
+        top_pairs = heapq.nlargest(
+            15,
             node_pair.items(),
             key=lambda x: (x[1].get("total_p95_ms") or -1),
-            reverse=True,
-        )[:15]
+        )
         for key, m in top_pairs:
-            lines.append(f"  {key}: samples={m.get('samples', 0)} p95={format_ms(m.get('total_p95_ms'))} p99={format_ms(m.get('total_p99_ms'))}")
+            w(f"  {key}: samples={m.get('samples', 0)} p95={format_ms(m.get('total_p95_ms'))} p99={format_ms(m.get('total_p99_ms'))}\n")
     else:
-        lines.append("  No node-pair aggregation (need s2s probes with source_node).")
+        w("  No node-pair aggregation (need s2s probes with source_node).\n")
 
     # 6) Pod spread on fixed nodes (no node scaling)
     if spread_stats:
-        lines.append("6) Pod spread across fixed nodes (no node scaling)")
-        lines.append("-" * 80)
-        lines.append("  node_count = number of nodes that have ≥1 workload pod (cluster size is fixed).")
+        w("6) Pod spread across fixed nodes (no node scaling)\n")
+        w("-" * 80 + "\n")
+        w("  node_count = number of nodes that have ≥1 workload pod (cluster size is fixed).\n")
         dist = spread_stats.get("node_count_distribution", {})
         if dist:
-            lines.append(f"  node_count range: {spread_stats.get('node_count_min', '')} – {spread_stats.get('node_count_max', '')}")
-            lines.append("  Distribution (snapshots): " + ", ".join(f"{k} nodes ({v})" for k, v in sorted(dist.items())))
+            w(f"  node_count range: {spread_stats.get('node_count_min', '')} – {spread_stats.get('node_count_max', '')}\n")
+            w("  Distribution (snapshots): " + ", ".join(f"{k} nodes ({v})" for k, v in sorted(dist.items())) + "\n")
         corr = spread_stats.get("node_count_p95_correlation")
         if corr is not None:
-            lines.append(f"  Correlation(node_count, s2s_p95_ms): {corr:.3f}")
+            w(f"  Correlation(node_count, s2s_p95_ms): {corr:.3f}\n")
             if corr > 0.3:
-                lines.append("  → Higher spread across nodes tends to increase latency (cross-node cost).")
+                w("  → Higher spread across nodes tends to increase latency (cross-node cost).\n")
             elif corr < -0.2:
-                lines.append("  → More spread here associated with lower latency (e.g. less contention).")
-        lines.append("")
+                w("  → More spread here associated with lower latency (e.g. less contention).\n")
+        w("\n")
 
-    (network_dir / "analysis-summary.txt").write_text("\n".join(lines) + "\n")
+    (network_dir / "analysis-summary.txt").write_text(buf.getvalue(), encoding="utf-8")
 
 
 def compute_spread_correlation(csv_path: Path) -> Optional[dict]:
@@ -676,13 +759,10 @@ def compute_spread_correlation(csv_path: Path) -> Optional[dict]:
     Relevant when nodes are fixed: measures how pod spread across those nodes relates to latency."""
     if not csv_path.exists():
         return None
-    rows: List[dict] = []
-    with open(csv_path) as f:
-        header = [h.strip() for h in f.readline().strip().split(",")]
-        for line in f:
-            values = line.strip().split(",")
-            if len(values) >= len(header):
-                rows.append(dict(zip(header, values)))
+    # csv.DictReader matches the csv.writer in build_latency_vs_replicas (quoted
+    # fields); cells missing from short rows come back as None and are skipped below
+    with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
+        rows: List[dict] = list(csv.DictReader(f))
     node_counts: List[float] = []
     p95_vals: List[float] = []
     dist: Dict[int, int] = defaultdict(int)
@@ -772,7 +852,7 @@ def write_recommendations(network_dir: Path, placement: dict, e2e: dict, s2s: di
     lines.append("- **Tail latency by (source_node, target_service)**: see `node-pair-latency-summary.json` and section 5 of `analysis-summary.txt`.")
     lines.append("- **Queueing vs network**: see section 4 of `analysis-summary.txt` (connect_avg vs queueing_avg = ttfb - connect per path).")
 
-    (network_dir / "experiment-metrics-recommendations.md").write_text("\n".join(lines) + "\n")
+    (network_dir / "experiment-metrics-recommendations.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def parse_args() -> argparse.Namespace:
@@ -814,9 +894,9 @@ def main() -> None:
 
     pod_snapshots = load_pod_snapshots(network_dir)
     service_to_nodes = load_service_endpoint_nodes(network_dir)
-    placement = summarize_pod_placement(pod_snapshots)
+    placement, ts_to_node_count = summarize_pod_placement(pod_snapshots)
     e2e = load_e2e_latency(load_dir)
-    s2s = load_service_to_service(network_dir, service_to_nodes)
+    s2s, s2s_by_ts = load_s2s_combined(network_dir, service_to_nodes)
 
     write_json(network_dir / "pod-placement-analysis.json", placement)
     write_json(network_dir / "e2e-latency-summary.json", e2e)
@@ -829,8 +909,7 @@ def main() -> None:
     })
 
     hpa_snapshots = load_hpa_snapshots(network_dir)
-    ts_to_node_count = get_ts_to_node_count(pod_snapshots)
-    latency_vs_replicas_path = build_latency_vs_replicas(network_dir, hpa_snapshots, ts_to_node_count)
+    latency_vs_replicas_path = build_latency_vs_replicas(network_dir, hpa_snapshots, s2s_by_ts, ts_to_node_count)
     spread_stats = compute_spread_correlation(latency_vs_replicas_path) if latency_vs_replicas_path else None
     write_text_report(network_dir, placement, e2e, s2s, spread_stats)
     write_recommendations(network_dir, placement, e2e, s2s)